@@ -0,0 +1,80 @@
+"""
+On-disk TTL cache for API responses
+
+Entries live under ~/.cache/sre_agent/<namespace>/ (or $XDG_CACHE_HOME/...), one
+file per key. A file's mtime is its fetch time, so nothing but the body is stored.
+Each tool uses its own namespace, so clearing or evicting one leaves the others.
+"""
+
+import os
+import time
+import shutil
+import hashlib
+import tempfile
+from typing import Optional
+
+
+CACHE_DIR = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache'),
+    'sre_agent'
+)
+
+
+def make_key(*parts: str) -> str:
+    """Hash a request description (command, URL, params...) into a cache key"""
+    return hashlib.sha1('\0'.join(parts).encode('utf-8')).hexdigest()
+
+
+def get(namespace: str, key: str, ttl: float) -> Optional[bytes]:
+    """Return the cached body for key if it is younger than ttl seconds"""
+    path = os.path.join(CACHE_DIR, namespace, key)
+    try:
+        if time.time() - os.path.getmtime(path) > ttl:
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+    except OSError:
+        return None
+
+
+def put(namespace: str, key: str, body: bytes) -> None:
+    """Store body under key, replacing any previous entry atomically"""
+    directory = os.path.join(CACHE_DIR, namespace)
+    tmp_path = None
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(body)
+        os.replace(tmp_path, os.path.join(directory, key))
+    except OSError:
+        # Caching is best-effort; a read-only or full disk shouldn't fail the run
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+
+def evict(namespace: str, max_age: float) -> None:
+    """Delete a namespace's entries (and leftover temp files) older than max_age seconds
+    
+    Keys that embed a time window are never read again once it moves on, so
+    without this the directory would grow on every run.
+    """
+    cutoff = time.time() - max_age
+    try:
+        entries = list(os.scandir(os.path.join(CACHE_DIR, namespace)))
+    except OSError:
+        return
+    for entry in entries:
+        try:
+            if entry.is_file(follow_symlinks=False) and entry.stat(follow_symlinks=False).st_mtime < cutoff:
+                os.remove(entry.path)
+        except OSError:
+            pass
+
+
+def clear(namespace: str) -> None:
+    """Remove every cached entry in a namespace"""
+    shutil.rmtree(os.path.join(CACHE_DIR, namespace), ignore_errors=True)
@@ -9,27 +9,166 @@ This version uses concurrent processing to speed up repository analysis.
 import os
 import sys
 import json
+import io
+import re
+import time
+import threading
 import subprocess
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional
-from collections import defaultdict
+from datetime import datetime, timezone
+from typing import List, Dict, Optional, Tuple
+from collections import Counter
 import argparse
 import concurrent.futures
-from functools import partial
+
+import cache
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps_indented(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:  # Optional speedup; stdlib json parses the same documents
+    orjson = None
+    _json_loads = json.loads
+    
+    def _json_dumps_indented(obj) -> bytes:
+        # Raw UTF-8 like orjson, so output doesn't depend on which is installed
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Report rules and markers reused across sections
+SEP = "=" * 80 + "\n"
+SUB = "-" * 80 + "\n"
+PR_STATE_EMOJI = {'MERGED': "✅", 'OPEN': "🔵"}  # Anything else (CLOSED) is ❌
+
+# Alert line templates, filled from the alert dict plus an upper-cased 'sev'
+ALERT_LINE = "      - [{sev}] {package}: {summary}\n".format_map
+ALERT_LINE_WITH_URL = "      - [{sev}] {package}: {summary}\n        {url}\n".format_map
+
+
+class RateLimiter:
+    """Token bucket that keeps GraphQL calls within GitHub's GraphQL quota
+    
+    The bucket holds the points GitHub reports as remaining (read from the
+    rateLimit block returned with every live batched query) and is refilled when
+    the quota resets. GraphQL calls only block once the budget is spent, instead
+    of running into 403s. REST calls draw on a separate quota and acquire at
+    zero cost, so they only wait out pause(), which holds every worker after a
+    secondary rate limit.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._remaining = None  # Unknown until the first GraphQL response
+        self._reported = None  # Last remaining count GitHub reported
+        self._reset_at = 0.0  # Epoch seconds when the quota refills
+        self._paused_until = 0.0
+    
+    def acquire(self, cost: int = 1) -> None:
+        """Block until a call costing `cost` points fits in the budget"""
+        with self._lock:
+            now = time.time()
+            wait = self._paused_until - now
+            if self._remaining is not None and now < self._reset_at:
+                if self._remaining < cost:
+                    wait = max(wait, self._reset_at - now)
+                else:
+                    self._remaining -= cost
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def update(self, remaining: int, reset_at: float) -> None:
+        """Refill the bucket from a GitHub quota reading
+        
+        Responses can arrive out of order, so a reading only replaces the
+        current one if it is for a later quota window or reports fewer points
+        left in the same window.
+        """
+        with self._lock:
+            if (reset_at > self._reset_at or self._reported is None
+                    or (reset_at == self._reset_at and remaining < self._reported)):
+                self._remaining = remaining
+                self._reported = remaining
+                self._reset_at = reset_at
+    
+    def pause(self, seconds: float) -> None:
+        """Hold all calls for `seconds`, e.g. after hitting a secondary rate limit"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.time() + seconds)
 
 
 class GitHubRepoMonitor:
     """Monitor GitHub repositories for changes and vulnerabilities using gh CLI"""
     
-    def __init__(self, max_workers: int = 10):
+    # Fields fetched for every repo in a batched GraphQL query. Mirrors what the
+    # per-repo REST calls return so both paths produce the same result shape.
+    REPO_ACTIVITY_FRAGMENT = """
+fragment RepoActivity on Repository {
+  isArchived
+  isDisabled
+  defaultBranchRef {
+    target {
+      ... on Commit {
+        history(since: $since, first: 100) {
+          nodes { oid messageHeadline author { name date } }
+        }
+      }
+    }
+  }
+  pullRequests(first: 100, orderBy: {field: UPDATED_AT, direction: DESC}) {
+    nodes { number title state author { login } updatedAt url }
+  }
+}
+"""
+    
+    # Only requested for repos whose alerts weren't already fetched org-wide
+    REPO_ALERTS_FRAGMENT = """
+fragment RepoAlerts on Repository {
+  vulnerabilityAlerts(first: 100, states: OPEN) {
+    nodes {
+      number
+      createdAt
+      securityVulnerability { package { name } }
+      securityAdvisory { severity summary identifiers { type value } }
+    }
+  }
+}
+"""
+    
+    # How long (seconds) cached gh responses stay fresh
+    ACTIVITY_TTL = 5 * 60  # Commits and PRs
+    ALERTS_TTL = 15 * 60  # Dependabot alerts
+    REPO_LIST_TTL = 6 * 60 * 60  # Topic search and iac-repos.txt
+    CACHE_NAMESPACE = 'github'  # Subdirectory of cache.CACHE_DIR holding gh responses
+    
+    # Retries (with exponential backoff from RATE_LIMIT_BACKOFF seconds) when gh
+    # reports a rate limit; GitHub asks clients to wait at least a minute
+    RATE_LIMIT_RETRIES = 2
+    RATE_LIMIT_BACKOFF = 60
+    
+    def __init__(self, max_workers: int = 10, batch_size: int = 25, use_cache: bool = True):
         """
         Initialize the monitor
         
         Args:
             max_workers: Maximum number of parallel workers (default: 10)
+            batch_size: Number of repos per batched GraphQL query (default: 25)
+            use_cache: Reuse recent gh responses from the on-disk cache (default: True)
         """
         self.org = 'LexisNexis-RBA'
         self.max_workers = max_workers
+        self.batch_size = batch_size
+        self.use_cache = use_cache
+        if use_cache:
+            # No entry outlives the longest TTL, so anything older is dead weight
+            cache.evict(self.CACHE_NAMESPACE, self.REPO_LIST_TTL)
+        self._gh_env = None  # Environment for gh subprocesses, set by _check_gh_cli
+        self._inflight = {}  # Command key -> Future of the gh call currently running it
+        self._inflight_lock = threading.Lock()
+        self._all_repos = None  # Cache for get_all_repos
+        self._org_alerts = None  # Org-wide Dependabot alerts by repo, set by run()
+        self._rate_limiter = RateLimiter()
         
         # Check if gh CLI is available
         if not self._check_gh_cli():
@@ -39,38 +178,123 @@ class GitHubRepoMonitor:
             )
     
     def _check_gh_cli(self) -> bool:
-        """Check if gh CLI is installed and authenticated"""
+        """Check if gh CLI is installed and authenticated
+        
+        'gh auth status' verifies the credentials against the API ('gh auth token'
+        alone succeeds with an expired or revoked token). The token is then
+        resolved once and passed to every later gh process via GH_TOKEN, so each
+        spawn skips its own credential store lookup.
+        """
         try:
-            result = subprocess.run(
+            status = subprocess.run(
                 ['gh', 'auth', 'status'],
                 capture_output=True,
                 text=True,
                 timeout=10
             )
-            return result.returncode == 0
-        except (FileNotFoundError, subprocess.TimeoutExpired):
-            return False
-    
-    def _run_gh_command(self, args: List[str]) -> Optional[str]:
-        """Run a gh CLI command and return output"""
-        try:
+            if status.returncode != 0:
+                return False
             result = subprocess.run(
-                ['gh'] + args,
+                ['gh', 'auth', 'token'],
                 capture_output=True,
                 text=True,
-                timeout=30,
-                check=True
+                timeout=10
             )
-            return result.stdout
-        except subprocess.CalledProcessError as e:
-            if 'not found' in e.stderr or '404' in e.stderr:
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return False
+        
+        token = result.stdout.strip()
+        if result.returncode != 0 or not token:
+            return False
+        
+        self._gh_env = {**os.environ, 'GH_TOKEN': token}
+        return True
+    
+    def _run_gh_command(self, args: List[str], input_text: Optional[str] = None,
+                        timeout: int = 30, check: bool = True,
+                        ttl: Optional[int] = None) -> Optional[bytes]:
+        """Run a gh CLI command and return its raw stdout bytes
+        
+        Output is left undecoded: JSON callers hand the bytes straight to the
+        parser, so no decoded str copy of large responses is ever held.
+        
+        With check=False the output is returned even if gh exits non-zero, which
+        is how gh reports partial GraphQL results. With a ttl, successful output
+        is served from and stored in the on-disk cache.
+        
+        Identical commands issued concurrently from worker threads share a single
+        gh process: later callers wait for the first one's result.
+        """
+        return self._run_gh_command_sourced(args, input_text, timeout, check, ttl)[0]
+    
+    def _run_gh_command_sourced(self, args: List[str], input_text: Optional[str] = None,
+                                timeout: int = 30, check: bool = True,
+                                ttl: Optional[int] = None) -> Tuple[Optional[bytes], bool]:
+        """Like _run_gh_command, but also report whether the output came from the on-disk cache"""
+        key = cache.make_key(*args, input_text or '')
+        if ttl and self.use_cache:
+            cached = cache.get(self.CACHE_NAMESPACE, key, ttl)
+            if cached is not None:
+                return cached, True
+        
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = concurrent.futures.Future()
+                self._inflight[key] = future
+        
+        if not is_leader:
+            return future.result(), False
+        
+        try:
+            output = self._exec_gh(args, input_text, timeout, check,
+                                   key if ttl and self.use_cache else None)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(output)
+            return output, False
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+    
+    def _exec_gh(self, args: List[str], input_text: Optional[str], timeout: int,
+                 check: bool, cache_key: Optional[str]) -> Optional[bytes]:
+        """Spawn gh and return its stdout, storing it under cache_key on success
+        
+        GraphQL calls are paced against the GraphQL point budget. Rate-limited
+        calls are retried after pausing every worker.
+        """
+        cost = 1 if args[:2] == ['api', 'graphql'] else 0
+        for attempt in range(self.RATE_LIMIT_RETRIES + 1):
+            self._rate_limiter.acquire(cost)
+            try:
+                result = subprocess.run(
+                    ['gh'] + args,
+                    input=input_text.encode('utf-8') if input_text is not None else None,
+                    capture_output=True,
+                    timeout=timeout,
+                    env=self._gh_env
+                )
+            except subprocess.TimeoutExpired:
                 return None
-            # Silently handle errors in parallel mode to avoid spam
-            return None
-        except subprocess.TimeoutExpired:
-            return None
-        except Exception:
+            except Exception:
+                return None
+            
+            if result.returncode == 0 or b'rate limit' not in result.stderr.lower():
+                break
+            if attempt < self.RATE_LIMIT_RETRIES:
+                self._rate_limiter.pause(self.RATE_LIMIT_BACKOFF * 2 ** attempt)
+        
+        if result.returncode != 0 and check:
+            # Not found, no access, etc. Silently handle errors in parallel mode to avoid spam
             return None
+        
+        if cache_key and result.returncode == 0:
+            cache.put(self.CACHE_NAMESPACE, cache_key, result.stdout)
+        return result.stdout
     
     def _run_gh_api(self, endpoint: str, params: Optional[Dict] = None) -> Optional[Dict]:
         """Run gh api command and return JSON"""
@@ -83,11 +307,52 @@ class GitHubRepoMonitor:
         output = self._run_gh_command(args)
         if output:
             try:
-                return json.loads(output)
+                return _json_loads(output)
             except json.JSONDecodeError:
                 return None
         return None
     
+    def _since(self, days: int) -> datetime:
+        """Start of the monitoring window
+        
+        Rounded down to the activity cache lifetime so repeated runs build the
+        same requests and can be served from the cache.
+        """
+        start = time.time() - days * 86400
+        return datetime.fromtimestamp(start - start % self.ACTIVITY_TTL, tz=timezone.utc)
+    
+    def _gh_graphql(self, query: str, variables: Optional[Dict] = None,
+                    ttl: Optional[int] = None) -> Optional[Dict]:
+        """Run a GraphQL query via gh api graphql and return the data payload
+        
+        Aliased sub-queries that fail (e.g. a repo we can't access) come back as
+        null while the rest of the batch is still usable. A rateLimit block in a
+        live response refreshes the rate limiter; cached responses carry an old
+        reading and are ignored.
+        """
+        args = ['api', 'graphql', '-F', 'query=@-']
+        for key, value in (variables or {}).items():
+            args.extend(['-f', f'{key}={value}'])
+        
+        output, from_cache = self._run_gh_command_sourced(args, input_text=query, timeout=60, check=False, ttl=ttl)
+        if not output:
+            return None
+        
+        try:
+            data = _json_loads(output).get('data')
+        except (json.JSONDecodeError, AttributeError):
+            return None
+        
+        rate_limit = data.get('rateLimit') if data and not from_cache else None
+        if rate_limit:
+            try:
+                reset_at = datetime.fromisoformat(rate_limit['resetAt'].replace('Z', '+00:00'))
+                self._rate_limiter.update(rate_limit['remaining'], reset_at.timestamp())
+            except (KeyError, TypeError, ValueError):
+                pass
+        
+        return data
+    
     def get_data_dragons_repos(self) -> List[str]:
         """Get repositories with data-dragons topic using gh search"""
         repos = []
@@ -98,13 +363,13 @@ class GitHubRepoMonitor:
             f'org:{self.org}', f'topic:data-dragons',
             '--json', 'fullName',
             '--limit', '1000'
-        ])
+        ], ttl=self.REPO_LIST_TTL)
         
         if not output:
             return repos
         
         try:
-            data = json.loads(output)
+            data = _json_loads(output)
             if not data:
                 return repos
             
@@ -124,18 +389,14 @@ class GitHubRepoMonitor:
         output = self._run_gh_command([
             'api',
             f'/repos/{self.org}/dsg-cirium-cdp-tools/contents/scripts/github-codeowners/iac-repos.txt',
-            '--jq', '.content'
-        ])
+            '--jq', '.content | @base64d'
+        ], ttl=self.REPO_LIST_TTL)
         
         if not output:
             return []
         
-        # Decode base64 content
-        import base64
-        try:
-            content = base64.b64decode(output.strip()).decode('utf-8')
-        except Exception:
-            return []
+        # gh's jq decodes the base64 content, so output is the file text
+        content = output.decode('utf-8', errors='replace')
         
         # Parse repos from file
         # The file contains just repo names, which need to be prefixed with lexisnexis-iac org
@@ -160,120 +421,222 @@ class GitHubRepoMonitor:
         return repos
     
     def get_all_repos(self) -> List[str]:
-        """Get combined list of all repos to monitor"""
-        repos = set()
+        """Get combined list of all repos to monitor
         
-        repos.update(self.get_data_dragons_repos())
-        repos.update(self.get_iac_repos_from_file())
+        Computed once per monitor; across runs the underlying gh calls are served
+        from the on-disk cache for REPO_LIST_TTL.
+        """
+        if self._all_repos is not None:
+            return self._all_repos
         
-        return sorted(list(repos))
+        # The two sources are independent gh calls, so fetch them concurrently
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            topic_repos = executor.submit(self.get_data_dragons_repos)
+            iac_repos = executor.submit(self.get_iac_repos_from_file)
+            
+            self._all_repos = sorted(set(topic_repos.result()).union(iac_repos.result()))
+        
+        return self._all_repos
+    
+    def get_repo_metadata(self, repo: str) -> Optional[Dict]:
+        """Get the archived/disabled flags for a repository
+        
+        The flags rarely change, so they are cached as long as the repo list and
+        the call is nearly always served from disk.
+        """
+        output = self._run_gh_command([
+            'api',
+            f'/repos/{repo}',
+            '--jq', '{archived, disabled}'
+        ], ttl=self.REPO_LIST_TTL)
+        
+        if not output:
+            return None
+        
+        try:
+            return _json_loads(output)
+        except json.JSONDecodeError:
+            return None
     
     def get_recent_commits(self, repo: str, days: int = 7) -> List[Dict]:
         """Get recent commits for a repository"""
-        since = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%dT%H:%M:%SZ')
+        since = self._since(days).strftime('%Y-%m-%dT%H:%M:%SZ')
         
+        # Query parameters go in the URL: gh api switches to POST when given -F fields
         output = self._run_gh_command([
             'api',
-            f'/repos/{repo}/commits',
-            '-F', f'since={since}',
-            '-F', 'per_page=100',
-            '--jq', '.[] | {sha: .sha[0:7], message: .commit.message, author: .commit.author.name, date: .commit.author.date}'
-        ])
+            f'/repos/{repo}/commits?since={since}&per_page=100'
+        ], ttl=self.ACTIVITY_TTL)
         
         if not output:
             return []
         
-        commits = []
-        for line in output.strip().split('\n'):
-            if line:
-                try:
-                    commit = json.loads(line)
-                    # Get first line of commit message
-                    commit['message'] = commit['message'].split('\n')[0]
-                    commits.append(commit)
-                except json.JSONDecodeError:
-                    continue
-        
-        return commits
+        try:
+            arr = _json_loads(output)
+            # partition() stops at the first newline instead of splitting the whole message
+            return [
+                {
+                    'sha': c['sha'][:7],
+                    'message': c['commit']['message'].partition('\n')[0],
+                    'author': c['commit']['author']['name'],
+                    'date': c['commit']['author']['date']
+                }
+                for c in arr
+            ]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return []
     
     def get_recent_prs(self, repo: str, days: int = 7) -> List[Dict]:
         """Get recent pull requests for a repository"""
-        since = datetime.now() - timedelta(days=days)
+        since = self._since(days)
         
         output = self._run_gh_command([
             'pr', 'list',
             '--repo', repo,
             '--state', 'all',
+            '--search', f'updated:>={since.date().isoformat()} sort:updated-desc',
             '--limit', '100',
             '--json', 'number,title,state,author,updatedAt,url'
-        ])
+        ], ttl=self.ACTIVITY_TTL)
         
         if not output:
             return []
         
         try:
-            all_prs = json.loads(output)
-            prs = []
-            
-            for pr in all_prs:
-                try:
-                    updated_at = datetime.fromisoformat(pr['updatedAt'].replace('Z', '+00:00'))
-                    if updated_at < since.astimezone(updated_at.tzinfo):
-                        continue
-                    
-                    prs.append({
-                        'number': pr['number'],
-                        'title': pr['title'],
-                        'state': pr['state'],
-                        'author': pr['author']['login'] if pr.get('author') else 'unknown',
-                        'updated_at': pr['updatedAt'],
-                        'url': pr['url']
-                    })
-                except (KeyError, ValueError):
-                    continue
-            
-            return prs
+            return self._filter_recent_prs(_json_loads(output), since)
         except json.JSONDecodeError:
             return []
     
+    def _filter_recent_prs(self, all_prs: List[Dict], since: datetime) -> List[Dict]:
+        """Keep PRs updated since the cutoff, projected to the report shape
+        
+        all_prs must be ordered by updatedAt, newest first (both the search query
+        and the GraphQL connection request that), so the scan stops at the first
+        PR older than the cutoff. GitHub timestamps are fixed-width UTC ISO-8601
+        strings, so they are compared to the cutoff as strings rather than parsed.
+        """
+        since_str = since.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+        prs = []
+        
+        for pr in all_prs:
+            updated_at = pr.get('updatedAt')
+            if not updated_at:
+                continue
+            if updated_at < since_str:
+                break
+            
+            try:
+                prs.append({
+                    'number': pr['number'],
+                    'title': pr['title'],
+                    'state': pr['state'],
+                    'author': pr['author']['login'] if pr.get('author') else 'unknown',
+                    'updated_at': updated_at,
+                    'url': pr['url']
+                })
+            except KeyError:
+                continue
+        
+        return prs
+    
     def get_dependabot_alerts(self, repo: str) -> List[Dict]:
-        """Get Dependabot security alerts for a repository"""
+        """Get Dependabot security alerts for a repository
+        
+        Served from the org-wide prefetch when it covers the repo.
+        """
+        prefetched = self._prefetched_alerts(repo)
+        if prefetched is not None:
+            return prefetched
+        
         # Use gh api to get dependabot alerts
         # Note: Query parameters must be in the URL for GET requests
         output = self._run_gh_command([
             'api',
-            f'/repos/{repo}/dependabot/alerts?state=open&per_page=100',
-            '--jq', '.[] | {number, severity: .security_advisory.severity, package: .security_vulnerability.package.name, summary: .security_advisory.summary, cve_id: .security_advisory.cve_id, url: .html_url, created_at}'
-        ])
+            f'/repos/{repo}/dependabot/alerts?state=open&per_page=100'
+        ], ttl=self.ALERTS_TTL)
         
         if not output:
             return []
         
-        alerts = []
-        for line in output.strip().split('\n'):
-            if line:
-                try:
-                    alert = json.loads(line)
-                    if not alert.get('cve_id'):
-                        alert['cve_id'] = 'N/A'
-                    alerts.append(alert)
-                except json.JSONDecodeError:
-                    continue
+        try:
+            return [self._project_alert(a) for a in _json_loads(output)]
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return []
+    
+    def get_org_dependabot_alerts(self) -> Optional[Dict[str, List[Dict]]]:
+        """Get open Dependabot alerts for every repo in the org, keyed by lowercased full repo name
         
-        return alerts
+        One paginated call replaces a call per repo. Returns None when the org
+        endpoint is unavailable (it needs org owner or security manager access),
+        so callers fall back to per-repo requests.
+        """
+        output = self._run_gh_command([
+            'api', '--paginate',
+            f'/orgs/{self.org}/dependabot/alerts?state=open&per_page=100',
+            '--jq', '.[]'
+        ], timeout=120, ttl=self.ALERTS_TTL)
+        
+        if output is None:
+            return None
+        
+        alerts_by_repo = {}
+        try:
+            for line in output.splitlines():
+                if line:
+                    alert = _json_loads(line)
+                    # GitHub resolves names case-insensitively, and listed repos may differ in case
+                    repo = alert['repository']['full_name'].lower()
+                    alerts_by_repo.setdefault(repo, []).append(self._project_alert(alert))
+        except (json.JSONDecodeError, KeyError, TypeError):
+            return None
+        
+        return alerts_by_repo
+    
+    def _project_alert(self, alert: Dict) -> Dict:
+        """Project a REST Dependabot alert onto the fields used in the report"""
+        return {
+            'number': alert['number'],
+            'severity': alert['security_advisory']['severity'],
+            'package': alert['security_vulnerability']['package']['name'],
+            'summary': alert['security_advisory']['summary'],
+            'cve_id': alert['security_advisory']['cve_id'] or 'N/A',
+            'url': alert['html_url'],
+            'created_at': alert['created_at']
+        }
+    
+    def _prefetched_alerts(self, repo: str) -> Optional[List[Dict]]:
+        """Alerts for repo from the org-wide prefetch, or None if it isn't covered"""
+        if self._org_alerts is None or not self._is_org_repo(repo):
+            return None
+        return self._org_alerts.get(repo.lower(), [])
+    
+    def _is_org_repo(self, repo: str) -> bool:
+        """Whether repo belongs to self.org (GitHub owner names are case-insensitive)"""
+        return repo.split('/', 1)[0].lower() == self.org.lower()
     
     def analyze_repo(self, repo: str, days: int = 7, verbose: bool = True) -> Dict:
         """Analyze a single repository for changes and vulnerabilities"""
         if verbose:
             print(f"  Analyzing {repo}...", end='', flush=True)
         
-        commits = self.get_recent_commits(repo, days)
-        prs = self.get_recent_prs(repo, days)
+        # Archived and disabled repos can't have new activity, so skip those calls.
+        # pushed_at isn't used to skip commits or PRs: a cached value can miss a
+        # recent push, and PRs change (reviews, comments, fork pushes) without
+        # touching the repo's own pushed_at.
+        meta = self.get_repo_metadata(repo) or {}
+        commits, prs = [], []
+        if not (meta.get('archived') or meta.get('disabled')):
+            commits = self.get_recent_commits(repo, days)
+            prs = self.get_recent_prs(repo, days)
         alerts = self.get_dependabot_alerts(repo)
         
         if verbose:
             print(f" ✓ ({len(commits)} commits, {len(prs)} PRs, {len(alerts)} alerts)")
         
+        return self._build_result(repo, commits, prs, alerts)
+    
+    def _build_result(self, repo: str, commits: List[Dict], prs: List[Dict], alerts: List[Dict]) -> Dict:
+        """Assemble the per-repo result dict consumed by the report"""
         return {
             'repo': repo,
             'recent_commits': commits,
@@ -283,49 +646,127 @@ class GitHubRepoMonitor:
             'has_vulnerabilities': len(alerts) > 0
         }
     
+    def _build_batch_query(self, repos: List[str]) -> str:
+        """Build one GraphQL query with an aliased repository() lookup per repo"""
+        lookups = []
+        needs_alerts = False
+        for i, repo in enumerate(repos):
+            owner, name = repo.split('/', 1)
+            fragments = '...RepoActivity'
+            if self._prefetched_alerts(repo) is None:
+                fragments += ' ...RepoAlerts'
+                needs_alerts = True
+            lookups.append(
+                f'  r{i}: repository(owner: {json.dumps(owner)}, name: {json.dumps(name)}) {{ {fragments} }}'
+            )
+        
+        # rateLimit rides along with every batch so the limiter tracks the real quota
+        lookups.append('  rateLimit { remaining resetAt }')
+        
+        query = 'query($since: GitTimestamp!) {\n' + '\n'.join(lookups) + '\n}\n' + self.REPO_ACTIVITY_FRAGMENT
+        # GraphQL rejects fragments that are defined but never spread
+        if needs_alerts:
+            query += self.REPO_ALERTS_FRAGMENT
+        return query
+    
+    def _parse_repo_node(self, repo: str, node: Optional[Dict], since: datetime) -> Dict:
+        """Convert a GraphQL repository node into the per-repo result shape"""
+        if not node:
+            return self._build_result(repo, [], [], self._prefetched_alerts(repo) or [])
+        
+        commits, prs = [], []
+        # Archived and disabled repos report no activity, matching the per-repo path
+        if not (node.get('isArchived') or node.get('isDisabled')):
+            target = (node.get('defaultBranchRef') or {}).get('target') or {}
+            for commit in (target.get('history') or {}).get('nodes') or []:
+                author = commit.get('author') or {}
+                commits.append({
+                    'sha': commit['oid'][:7],
+                    'message': commit['messageHeadline'],
+                    'author': author.get('name'),
+                    'date': author.get('date')
+                })
+            
+            prs = self._filter_recent_prs((node.get('pullRequests') or {}).get('nodes') or [], since)
+        
+        alerts = self._prefetched_alerts(repo)
+        if alerts is not None:
+            return self._build_result(repo, commits, prs, alerts)
+        
+        alerts = []
+        for alert in (node.get('vulnerabilityAlerts') or {}).get('nodes') or []:
+            advisory = alert.get('securityAdvisory') or {}
+            package = (alert.get('securityVulnerability') or {}).get('package') or {}
+            cve_ids = [i['value'] for i in advisory.get('identifiers') or [] if i.get('type') == 'CVE']
+            # GraphQL severities are enum names (MODERATE), REST uses lowercase (medium)
+            severity = (advisory.get('severity') or '').lower()
+            alerts.append({
+                'number': alert['number'],
+                'severity': 'medium' if severity == 'moderate' else severity,
+                'package': package.get('name'),
+                'summary': advisory.get('summary'),
+                'cve_id': cve_ids[0] if cve_ids else 'N/A',
+                'url': f"https://github.com/{repo}/security/dependabot/{alert['number']}",
+                'created_at': alert.get('createdAt')
+            })
+        
+        return self._build_result(repo, commits, prs, alerts)
+    
+    def analyze_repo_batch(self, repos: List[str], days: int = 7) -> List[Dict]:
+        """Analyze a batch of repositories with a single GraphQL query
+        
+        Falls back to per-repo analysis if the batched query fails outright.
+        """
+        since = self._since(days)
+        
+        data = self._gh_graphql(
+            self._build_batch_query(repos),
+            {'since': since.strftime('%Y-%m-%dT%H:%M:%SZ')},
+            ttl=self.ACTIVITY_TTL
+        )
+        if data is None:
+            return [self.analyze_repo(repo, days, verbose=False) for repo in repos]
+        
+        return [self._parse_repo_node(repo, data.get(f'r{i}'), since) for i, repo in enumerate(repos)]
+    
     def analyze_repos_parallel(self, repos: List[str], days: int = 7, quiet: bool = False) -> List[Dict]:
-        """Analyze multiple repositories in parallel"""
+        """Analyze multiple repositories in parallel, one GraphQL query per batch"""
+        batches = [repos[i:i + self.batch_size] for i in range(0, len(repos), self.batch_size)]
+        # No point holding more threads than there are batches to run
+        workers = max(1, min(self.max_workers, len(batches)))
+        
         if not quiet:
-            print(f"\nAnalyzing {len(repos)} repositories (using {self.max_workers} workers)...", file=sys.stderr)
+            print(f"\nAnalyzing {len(repos)} repositories in {len(batches)} batches (using {workers} workers)...", file=sys.stderr)
         
         results = []
         completed = 0
         total = len(repos)
         
-        # Create a partial function with fixed days parameter
-        analyze_func = partial(self.analyze_repo, days=days, verbose=False)
-        
-        with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_repo = {executor.submit(analyze_func, repo): repo for repo in repos}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            # Submit all batches
+            future_to_batch = {executor.submit(self.analyze_repo_batch, batch, days): batch for batch in batches}
             
-            # Process completed tasks
-            for future in concurrent.futures.as_completed(future_to_repo):
-                repo = future_to_repo[future]
-                completed += 1
+            # Process completed batches
+            for future in concurrent.futures.as_completed(future_to_batch):
+                batch = future_to_batch[future]
+                completed += len(batch)
                 
                 try:
-                    result = future.result()
-                    results.append(result)
+                    results.extend(future.result())
                     
                     # Progress indicator
-                    if not quiet and (completed % 10 == 0 or completed == total):
+                    if not quiet:
                         pct = (completed / total) * 100
-                        print(f"  Progress: {completed}/{total} ({pct:.0f}%) - Latest: {repo}", file=sys.stderr)
+                        print(f"  Progress: {completed}/{total} ({pct:.0f}%) - Latest: {batch[-1]}", file=sys.stderr)
                 
                 except Exception as e:
                     if not quiet:
-                        print(f"  Error analyzing {repo}: {e}", file=sys.stderr)
-                    # Add a failed result
-                    results.append({
-                        'repo': repo,
-                        'recent_commits': [],
-                        'recent_prs': [],
-                        'dependabot_alerts': [],
-                        'has_activity': False,
-                        'has_vulnerabilities': False,
-                        'error': str(e)
-                    })
+                        print(f"  Error analyzing batch ending {batch[-1]}: {e}", file=sys.stderr)
+                    # Add a failed result for every repo in the batch
+                    for repo in batch:
+                        result = self._build_result(repo, [], [], [])
+                        result['error'] = str(e)
+                        results.append(result)
         
         # Sort results by repo name for consistent output
         results.sort(key=lambda x: x['repo'])
@@ -333,138 +774,157 @@ class GitHubRepoMonitor:
     
     def generate_report(self, results: List[Dict], days: int = 7) -> str:
         """Generate a formatted report"""
-        lines = []
-        lines.append("=" * 80)
-        lines.append(f"GitHub Repository Monitoring Report (Parallel Mode)")
-        lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        lines.append(f"Monitoring Period: Last {days} days")
-        lines.append("=" * 80)
-        lines.append("")
-        
-        # Summary statistics
+        buf = io.StringIO()
+        w = buf.write
+        w(SEP)
+        w(f"GitHub Repository Monitoring Report (Parallel Mode)\n")
+        w(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w(f"Monitoring Period: Last {days} days\n")
+        w(SEP)
+        w("\n")
+        
+        # Summary statistics and report sections, gathered in a single pass
         total_repos = len(results)
-        active_repos = sum(1 for r in results if r['has_activity'])
-        vulnerable_repos = sum(1 for r in results if r['has_vulnerabilities'])
-        total_alerts = sum(len(r['dependabot_alerts']) for r in results)
-        errors = sum(1 for r in results if 'error' in r)
-        
-        lines.append("📊 SUMMARY")
-        lines.append("-" * 80)
-        lines.append(f"Total Repositories: {total_repos}")
-        lines.append(f"Repos with Recent Activity: {active_repos}")
-        lines.append(f"Repos with Vulnerabilities: {vulnerable_repos}")
-        lines.append(f"Total Open Dependabot Alerts: {total_alerts}")
-        if errors > 0:
-            lines.append(f"Errors encountered: {errors}")
-        lines.append("")
+        active_repos = 0
+        vulnerable_repos = 0
+        total_alerts = 0
+        errors = 0
+        severity_counts = Counter()
+        repo_severity_counts = {}  # Repo name -> Counter of its alert severities
+        high_priority = []  # Active repos with vulnerabilities
+        vulnerable_only = []
+        active_clean = []
+        quiet_repos = []  # No activity, no vulnerabilities, no errors
         
-        # Severity breakdown
-        severity_counts = defaultdict(int)
-        for result in results:
-            for alert in result['dependabot_alerts']:
+        for r in results:
+            failed = 'error' in r
+            if failed:
+                errors += 1
+            
+            alerts = r['dependabot_alerts']
+            total_alerts += len(alerts)
+            if alerts:
+                by_severity = Counter(alert.get('severity', '') for alert in alerts)
+                repo_severity_counts[r['repo']] = by_severity
                 # Normalize severity to lowercase for consistent counting
-                severity = alert.get('severity', '').lower()
-                if severity:
-                    severity_counts[severity] += 1
+                for severity, count in by_severity.items():
+                    if severity:
+                        severity_counts[severity.lower()] += count
+            
+            if r['has_activity']:
+                active_repos += 1
+                if r['has_vulnerabilities']:
+                    vulnerable_repos += 1
+                    high_priority.append(r)
+                else:
+                    active_clean.append(r)
+            elif r['has_vulnerabilities']:
+                vulnerable_repos += 1
+                vulnerable_only.append(r)
+            elif not failed:
+                quiet_repos.append(r)
+        
+        w("📊 SUMMARY\n")
+        w(SUB)
+        w(f"Total Repositories: {total_repos}\n")
+        w(f"Repos with Recent Activity: {active_repos}\n")
+        w(f"Repos with Vulnerabilities: {vulnerable_repos}\n")
+        w(f"Total Open Dependabot Alerts: {total_alerts}\n")
+        if errors > 0:
+            w(f"Errors encountered: {errors}\n")
+        w("\n")
         
+        # Severity breakdown
         if severity_counts:
-            lines.append("🚨 VULNERABILITY SEVERITY BREAKDOWN")
-            lines.append("-" * 80)
+            w("🚨 VULNERABILITY SEVERITY BREAKDOWN\n")
+            w(SUB)
             for severity in ['critical', 'high', 'medium', 'low']:
                 if severity in severity_counts:
-                    lines.append(f"  {severity.upper()}: {severity_counts[severity]}")
-            lines.append("")
+                    w(f"  {severity.upper()}: {severity_counts[severity]}\n")
+            w("\n")
         
         # Repos with both activity and vulnerabilities (HIGH PRIORITY)
-        high_priority = [r for r in results if r['has_activity'] and r['has_vulnerabilities']]
         if high_priority:
-            lines.append("🔥 HIGH PRIORITY: Active Repos with Vulnerabilities")
-            lines.append("-" * 80)
+            w("🔥 HIGH PRIORITY: Active Repos with Vulnerabilities\n")
+            w(SUB)
             for result in sorted(high_priority, key=lambda x: len(x['dependabot_alerts']), reverse=True):
-                lines.append(f"\n📦 {result['repo']}")
-                lines.append(f"   Activity: {len(result['recent_commits'])} commits, {len(result['recent_prs'])} PRs")
-                lines.append(f"   Vulnerabilities: {len(result['dependabot_alerts'])} open alerts")
+                w(f"\n📦 {result['repo']}\n")
+                w(f"   Activity: {len(result['recent_commits'])} commits, {len(result['recent_prs'])} PRs\n")
+                w(f"   Vulnerabilities: {len(result['dependabot_alerts'])} open alerts\n")
                 
                 # Show recent PRs with links
                 if result['recent_prs']:
-                    lines.append(f"   📝 Recent PRs:")
+                    w(f"   📝 Recent PRs:\n")
                     for pr in result['recent_prs'][:3]:  # Show top 3
-                        state_emoji = "✅" if pr['state'] == 'MERGED' else "🔵" if pr['state'] == 'OPEN' else "❌"
-                        lines.append(f"      {state_emoji} #{pr['number']}: {pr['title'][:60]}...")
-                        lines.append(f"         {pr['url']}")
+                        state_emoji = PR_STATE_EMOJI.get(pr['state'], "❌")
+                        w(f"      {state_emoji} #{pr['number']}: {pr['title'][:60]}...\n")
+                        w(f"         {pr['url']}\n")
                 
                 # Show critical/high alerts
                 critical_alerts = [a for a in result['dependabot_alerts'] 
                                  if a['severity'] in ['critical', 'high']]
                 if critical_alerts:
-                    lines.append(f"   ⚠️  Critical/High Severity Alerts:")
+                    w(f"   ⚠️  Critical/High Severity Alerts:\n")
                     for alert in critical_alerts[:3]:  # Show top 3
-                        lines.append(f"      - [{alert['severity'].upper()}] {alert['package']}: {alert['summary']}")
-                        lines.append(f"        {alert['url']}")
+                        w(ALERT_LINE_WITH_URL({**alert, 'sev': alert['severity'].upper()}))
                 
                 # Show all other alerts (medium/low)
                 other_alerts = [a for a in result['dependabot_alerts'] 
                                if a['severity'] not in ['critical', 'high']]
                 if other_alerts:
-                    lines.append(f"   📋 Other Alerts ({len(other_alerts)}):")
+                    w(f"   📋 Other Alerts ({len(other_alerts)}):\n")
                     for alert in other_alerts[:3]:  # Show top 3
-                        lines.append(f"      - [{alert['severity'].upper()}] {alert['package']}: {alert['summary']}")
-                        lines.append(f"        {alert['url']}")
-            lines.append("")
+                        w(ALERT_LINE_WITH_URL({**alert, 'sev': alert['severity'].upper()}))
+            w("\n")
         
         # Repos with vulnerabilities only
-        vulnerable_only = [r for r in results if r['has_vulnerabilities'] and not r['has_activity']]
         if vulnerable_only:
-            lines.append("⚠️  REPOS WITH VULNERABILITIES (No Recent Activity)")
-            lines.append("-" * 80)
+            w("⚠️  REPOS WITH VULNERABILITIES (No Recent Activity)\n")
+            w(SUB)
             for result in sorted(vulnerable_only, key=lambda x: len(x['dependabot_alerts']), reverse=True):
-                lines.append(f"\n📦 {result['repo']}")
-                lines.append(f"   Vulnerabilities: {len(result['dependabot_alerts'])} open alerts")
+                w(f"\n📦 {result['repo']}\n")
+                w(f"   Vulnerabilities: {len(result['dependabot_alerts'])} open alerts\n")
                 
                 # Group by severity
-                by_severity = defaultdict(int)
-                for alert in result['dependabot_alerts']:
-                    by_severity[alert['severity']] += 1
+                by_severity = repo_severity_counts[result['repo']]
                 severity_str = ', '.join([f"{sev}: {count}" for sev, count in sorted(by_severity.items())])
-                lines.append(f"   Severity breakdown: {severity_str}")
+                w(f"   Severity breakdown: {severity_str}\n")
                 
                 # Show top critical/high alerts
                 critical_alerts = [a for a in result['dependabot_alerts'] 
                                  if a['severity'] in ['critical', 'high']]
                 if critical_alerts:
-                    lines.append(f"   Top alerts:")
+                    w(f"   Top alerts:\n")
                     for alert in critical_alerts[:2]:
-                        lines.append(f"      - [{alert['severity'].upper()}] {alert['package']}: {alert['summary']}")
-            lines.append("")
+                        w(ALERT_LINE({**alert, 'sev': alert['severity'].upper()}))
+            w("\n")
         
         # Active repos without vulnerabilities
-        active_clean = [r for r in results if r['has_activity'] and not r['has_vulnerabilities']]
         if active_clean:
-            lines.append("✅ ACTIVE REPOS (No Vulnerabilities)")
-            lines.append("-" * 80)
+            w("✅ ACTIVE REPOS (No Vulnerabilities)\n")
+            w(SUB)
             for result in active_clean:
-                lines.append(f"\n📦 {result['repo']}: {len(result['recent_commits'])} commits, {len(result['recent_prs'])} PRs")
+                w(f"\n📦 {result['repo']}: {len(result['recent_commits'])} commits, {len(result['recent_prs'])} PRs\n")
                 # Show PR links for active repos
                 if result['recent_prs']:
                     for pr in result['recent_prs'][:2]:  # Show top 2
-                        state_emoji = "✅" if pr['state'] == 'MERGED' else "🔵" if pr['state'] == 'OPEN' else "❌"
-                        lines.append(f"   {state_emoji} #{pr['number']}: {pr['title'][:60]}... - {pr['url']}")
-            lines.append("")
+                        state_emoji = PR_STATE_EMOJI.get(pr['state'], "❌")
+                        w(f"   {state_emoji} #{pr['number']}: {pr['title'][:60]}... - {pr['url']}\n")
+            w("\n")
         
         # Quiet repos (no activity, no vulnerabilities)
-        quiet_repos = [r for r in results if not r['has_activity'] and not r['has_vulnerabilities'] and 'error' not in r]
         if quiet_repos:
-            lines.append(f"😴 QUIET REPOS (No Activity, No Vulnerabilities): {len(quiet_repos)} repos")
-            lines.append("-" * 80)
+            w(f"😴 QUIET REPOS (No Activity, No Vulnerabilities): {len(quiet_repos)} repos\n")
+            w(SUB)
             for result in quiet_repos[:10]:  # Show first 10
-                lines.append(f"  {result['repo']}")
+                w(f"  {result['repo']}\n")
             if len(quiet_repos) > 10:
-                lines.append(f"  ... and {len(quiet_repos) - 10} more")
-            lines.append("")
+                w(f"  ... and {len(quiet_repos) - 10} more\n")
+            w("\n")
         
-        lines.append("=" * 80)
+        w("=" * 80)
         
-        return '\n'.join(lines)
+        return buf.getvalue()
     
     def run(self, days: int = 7, output_file: Optional[str] = None, 
             filter_repos: Optional[List[str]] = None, parallel: bool = True,
@@ -479,11 +939,19 @@ class GitHubRepoMonitor:
         
         # Filter repos if specified
         if filter_repos:
-            repos = [r for r in repos if any(f in r for f in filter_repos)]
+            # One regex scan per repo instead of a substring scan per filter
+            pattern = re.compile('|'.join(map(re.escape, filter_repos)))
+            repos = [r for r in repos if pattern.search(r)]
         
         if not quiet:
             print(f"\nFound {len(repos)} repositories to monitor", file=sys.stderr)
         
+        # Prefetch Dependabot alerts for the whole org in one paginated call
+        if any(self._is_org_repo(r) for r in repos):
+            self._org_alerts = self.get_org_dependabot_alerts()
+            if self._org_alerts is None and not quiet:
+                print("Org-wide Dependabot alerts unavailable, fetching per repo", file=sys.stderr)
+        
         # Analyze repos
         if parallel:
             results = self.analyze_repos_parallel(repos, days, quiet=quiet)
@@ -501,7 +969,10 @@ class GitHubRepoMonitor:
         
         # Output JSON to stdout if requested (agent-friendly)
         if json_output:
-            print(json.dumps(results, indent=2))
+            # Same bytes as the .json sidecar written with --output
+            sys.stdout.flush()
+            sys.stdout.buffer.write(_json_dumps_indented(results) + b'\n')
+            sys.stdout.buffer.flush()
             return
         
         # Generate human-readable report
@@ -509,15 +980,16 @@ class GitHubRepoMonitor:
         
         # Save to file if requested, otherwise print to stdout
         if output_file:
-            with open(output_file, 'w') as f:
-                f.write(report)
+            # Binary mode: encode once and write in a single call
+            with open(output_file, 'wb') as f:
+                f.write(report.encode('utf-8'))
             if not quiet:
                 print(f"📄 Report saved to: {output_file}", file=sys.stderr)
             
             # Also save JSON data alongside
             json_file = output_file.replace('.txt', '.json')
-            with open(json_file, 'w') as f:
-                json.dump(results, f, indent=2)
+            with open(json_file, 'wb') as f:
+                f.write(_json_dumps_indented(results))
             if not quiet:
                 print(f"📄 JSON data saved to: {json_file}", file=sys.stderr)
         else:
@@ -555,6 +1027,9 @@ Examples:
   
   # Filter specific repos
   python github_repo_watcher.py --filter data-dragons --filter cdp-tools
+  
+  # Ignore cached GitHub responses for this run
+  python github_repo_watcher.py --no-cache
 
 Requirements:
   - GitHub CLI (gh) must be installed and authenticated
@@ -562,8 +1037,9 @@ Requirements:
   - Requires permissions to read repos and security alerts
 
 Performance:
-  - Parallel mode (default): ~15-30 seconds for 120 repos
-  - Sequential mode: ~2 minutes for 120 repos
+  - Parallel mode (default): one batched GraphQL query per 25 repos
+  - Sequential mode: ~2 minutes for 120 repos (3 gh calls per repo, plus a
+    repo metadata lookup cached for 6 hours; archived repos need fewer)
   - Workers: Default 10, increase for faster processing (but watch API limits)
         """
     )
@@ -596,12 +1072,31 @@ Performance:
         help='Number of parallel workers (default: 10, max recommended: 20)'
     )
     
+    parser.add_argument(
+        '--batch-size',
+        type=int,
+        default=25,
+        help='Number of repos fetched per batched GraphQL query (default: 25)'
+    )
+    
     parser.add_argument(
         '--no-parallel',
         action='store_true',
         help='Disable parallel processing (slower but more conservative)'
     )
     
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Always query GitHub instead of reusing recent responses from ~/.cache/sre_agent'
+    )
+    
+    parser.add_argument(
+        '--clear-cache',
+        action='store_true',
+        help='Delete cached GitHub responses before running'
+    )
+    
     parser.add_argument(
         '--json',
         action='store_true',
@@ -617,7 +1112,14 @@ Performance:
     args = parser.parse_args()
     
     try:
-        monitor = GitHubRepoMonitor(max_workers=args.workers)
+        if args.clear_cache:
+            cache.clear(GitHubRepoMonitor.CACHE_NAMESPACE)
+        
+        monitor = GitHubRepoMonitor(
+            max_workers=args.workers,
+            batch_size=args.batch_size,
+            use_cache=not args.no_cache
+        )
         monitor.run(
             days=args.days, 
             output_file=args.output, 
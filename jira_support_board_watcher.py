@@ -16,16 +16,232 @@ Uses Jira REST API to interact with Atlassian Jira.
 import json
 import sys
 import os
-from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
+import time
+import threading
+from functools import lru_cache
+from itertools import islice
+from collections import namedtuple
+from types import MappingProxyType
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 import yaml
 
+import cache
 
-@dataclass
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+except ImportError:  # Optional speedup; stdlib json parses the same documents
+    _json_loads = json.loads
+    
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+try:
+    import ciso8601
+except ImportError:  # Optional speedup; strptime parses the same timestamps
+    ciso8601 = None
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml; the pure-Python loader is equivalent
+    from yaml import SafeLoader as _YamlLoader
+
+
+# Epoch used to sort issues that lack the sort field
+_MIN_TS = datetime.min.replace(tzinfo=timezone.utc)
+
+# Shared read-only default for missing/null sub-objects in .get() chains
+_EMPTY = MappingProxyType({})
+
+# Project roles that make up the core team (see _get_project_members)
+_TEAM_ROLES = frozenset({'Member', 'Administrator'})
+
+# Comment authors with this email suffix are internal; anyone else is a customer
+_INTERNAL_DOMAIN = '@cirium.com'
+
+# Subdirectory of cache.CACHE_DIR holding parsed copies of config.yaml
+_CONFIG_CACHE_NAMESPACE = 'config'
+
+# Issue fields the report reads; searches fetch only these by default
+_REPORT_FIELDS = ('summary', 'status', 'assignee', 'created', 'updated', 'resolutiondate')
+
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a JSON response body, parsing the raw bytes directly"""
+    try:
+        return _json_loads(response.content)
+    except ValueError as e:
+        # Surface bad bodies as a RequestException, like response.json() does
+        raise requests.exceptions.InvalidJSONError(str(e), response=response)
+
+
+def _load_config(config_path: str) -> Dict[str, Any]:
+    """
+    Load config.yaml, reusing a parsed JSON copy from the on-disk cache
+    
+    The copy is keyed by the file's path and records its mtime and size, so
+    editing the file invalidates (and the next parse overwrites) the copy, and
+    only the first run after a change parses YAML.
+    """
+    stat = os.stat(config_path)
+    key = cache.make_key(os.path.abspath(config_path))
+    
+    cached = cache.get(_CONFIG_CACHE_NAMESPACE, key, float('inf'))
+    if cached is not None:
+        try:
+            entry = _json_loads(cached)
+            if entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+                return entry['config']
+        except (ValueError, KeyError, TypeError):
+            pass  # Unreadable copy; parse the YAML and replace it
+    
+    with open(config_path, 'r') as f:
+        config = yaml.load(f, Loader=_YamlLoader) or {}
+    try:
+        entry = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'config': config}
+        cache.put(_CONFIG_CACHE_NAMESPACE, key, _json_dumps(entry))
+    except TypeError:
+        pass  # Values JSON can't hold (e.g. YAML dates); just parse YAML each run
+    return config
+
+
+# An issue's updated/created stamps are read by several buckets' sorts and
+# filters; caching means each distinct string is parsed once per run
+@lru_cache(maxsize=4096)
+def _parse_jira_ts(value: str) -> datetime:
+    """Parse a Jira timestamp such as '2024-01-31T09:15:00.000+0000'"""
+    if ciso8601 is not None:
+        return ciso8601.parse_datetime(value)
+    # fromisoformat only accepts the +0000 offset form from Python 3.11
+    return datetime.strptime(value, '%Y-%m-%dT%H:%M:%S.%f%z')
+
+
+def _sort_issues(issues: List[Dict[str, Any]], field: str, descending: bool = False) -> List[Dict[str, Any]]:
+    """Sort issues by a timestamp field, like a JQL ORDER BY clause"""
+    def key(issue):
+        value = issue['fields'].get(field)
+        return _parse_jira_ts(value) if value else _MIN_TS
+    
+    return sorted(issues, key=key, reverse=descending)
+
+
+def _scan_unack(comments: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Find customer comments with no later reply from the internal team
+    
+    Simple heuristic: comments from external users (not @cirium.com) that
+    don't have a later comment from an internal user.
+    
+    Args:
+        comments: An issue's comments, as returned in its comment field
+        
+    Returns:
+        List of unacknowledged customer comments
+    """
+    # A customer comment is acknowledged only by a newer internal comment, so
+    # only the newest internal comment matters: one pass to find it, one to filter
+    created = [_parse_jira_ts(comment.get('created', '')) for comment in comments]
+    last_internal = max(
+        (ts for comment, ts in zip(comments, created)
+         if ((comment.get('author') or _EMPTY).get('emailAddress') or '').endswith(_INTERNAL_DOMAIN)),
+        default=None
+    )
+    
+    unacknowledged = []
+    for comment, comment_created in zip(comments, created):
+        author_email = (comment.get('author') or _EMPTY).get('emailAddress')
+        if author_email and not author_email.endswith(_INTERNAL_DOMAIN):
+            if last_internal is None or last_internal <= comment_created:
+                unacknowledged.append(comment)
+    
+    return unacknowledged
+
+
+# The fields format_report shows for an issue, extracted once per issue
+_IssueView = namedtuple('_IssueView', 'key summary created updated resolved assignee_name status_name')
+
+
+def _to_view(issue: Dict[str, Any]) -> _IssueView:
+    """Extract an issue's display fields (assignee_name is None when unassigned)"""
+    f = issue.get('fields') or _EMPTY
+    return _IssueView(
+        key=issue.get('key', 'N/A'),
+        summary=f.get('summary', 'No summary'),
+        created=f.get('created', 'N/A'),
+        updated=f.get('updated', 'N/A'),
+        resolved=f.get('resolutiondate', 'N/A'),
+        assignee_name=(f.get('assignee') or _EMPTY).get('displayName'),
+        status_name=(f.get('status') or _EMPTY).get('name', 'Unknown')
+    )
+
+
+def _display_fields(issue: Dict[str, Any], unassigned: str = 'Unassigned', **extra) -> Dict[str, Any]:
+    """_to_view as a template mapping, with the section's label for unassigned issues"""
+    fields = _to_view(issue)._asdict()
+    fields['assignee_name'] = fields['assignee_name'] or unassigned
+    fields.update(extra)
+    return fields
+
+
+# Issue link line shared by the templates below ({key} filled by format_map)
+_LINK_LINE = "  - Link: https://cirium.atlassian.net/browse/{key}"
+# The comment activity list's indented link line, filled with %
+_ATTENTION_LINK_LINE = "   - Link: https://cirium.atlassian.net/browse/%s"
+
+# Per-issue templates for format_report's issue list sections, each rendering
+# an issue's whole multi-line block in one format_map call
+_CREATED_BLOCK = (
+    "- **{key}**: {summary}\n"
+    "  - Created: {created}\n"
+    "  - Assignee: {assignee_name}\n"
+    + _LINK_LINE
+)
+_IN_PROGRESS_BLOCK = (
+    "- **{key}**: {summary}\n"
+    "  - Status: {status_name}\n"
+    "  - Assignee: {assignee_name}\n"
+    "  - Last Updated: {updated}\n"
+    + _LINK_LINE
+)
+_UPDATED_BLOCK = (
+    "- **{key}**: {summary}\n"
+    "  - Assignee: {assignee_name}\n"
+    "  - Last Updated: {updated}\n"
+    + _LINK_LINE
+)
+_STALE_BLOCK = (
+    "- **🚨 {key}**: {summary}\n"
+    "  - Assignee: {assignee_name}\n"
+    "  - Last Updated: {updated}\n"
+    + _LINK_LINE
+)
+_UNACK_BLOCK = (
+    "- **{key}**: {summary}\n"
+    "  - Unacknowledged comments: {comment_count}\n"
+    + _LINK_LINE
+)
+_CLOSED_BLOCK = (
+    "- **{key}**: {summary}\n"
+    "  - Resolved by: {assignee_name}\n"
+    "  - Resolved: {resolved}\n"
+    + _LINK_LINE
+)
+
+
+# dataclass(slots=True) needs Python 3.10; older interpreters get a plain dataclass
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TriageReport:
     """Data structure for triage meeting report"""
     triage_items: List[Dict[str, Any]]
@@ -36,12 +252,27 @@ class TriageReport:
     unacknowledged_comments: List[Dict[str, Any]]
     recently_closed: List[Dict[str, Any]]
     items_by_comment_activity: List[Dict[str, Any]]
+    # Comment-activity summary, derived from items_by_comment_activity
+    items_needing_attention: List[Dict[str, Any]] = field(default_factory=list)
+    no_comment_count: int = 0
+    customer_last_comment_count: int = 0
+    # Stale items, unacknowledged comments or untriaged items need someone's attention
+    needs_action: bool = False
 
 
 class JiraBoardWatcher:
     """Watches a Jira board and generates triage reports"""
     
-    def __init__(self, jira_url: str, email: str, api_token: str, project_key: str, board_id: str = "404", team_name: Optional[str] = None, team_members: Optional[List[str]] = None):
+    # Retries for rate-limited (429) or unavailable (503) responses
+    MAX_RETRIES = 5
+    
+    # Page limit per search, to bound runaway queries. Jira returns far fewer
+    # issues per page than page_size when comments are requested (the
+    # consolidated triage search does), so this caps results well below
+    # MAX_SEARCH_PAGES * page_size; searches that hit it warn about truncation.
+    MAX_SEARCH_PAGES = 20
+    
+    def __init__(self, jira_url: str, email: str, api_token: str, project_key: str, board_id: str = "404", team_name: Optional[str] = None, team_members: Optional[List[str]] = None, page_size: int = 500):
         """
         Initialize the board watcher
         
@@ -53,6 +284,7 @@ class JiraBoardWatcher:
             board_id: Jira board ID (default: '404')
             team_name: Team name for identifying team members (e.g., 'Data Dragons')
             team_members: Optional list of team member emails for manual configuration
+            page_size: Issues requested per search page (default: 500; Jira may cap it lower)
         """
         self.jira_url = jira_url.rstrip('/')
         self.project_key = project_key
@@ -65,15 +297,113 @@ class JiraBoardWatcher:
             'Accept': 'application/json',
             'Content-Type': 'application/json'
         }
+        
+        # One pooled session for every call so connections (and TLS handshakes)
+        # are reused; the pool is sized for the concurrent comment checks.
+        # Transient 5xx errors are retried by the adapter; 429/503 are handled
+        # by _request_with_retry, which honors Retry-After.
+        self.session = requests.Session()
+        self.session.auth = self.auth
+        self.session.headers.update(self.headers)
+        retry = Retry(total=5, backoff_factor=0.3, status_forcelist=(500, 502, 504), raise_on_status=False)
+        self.session.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=32, max_retries=retry))
+        
+        # Fixed JQL for each search; the project key never changes after init
+        self._jql = {
+            'triage': (
+                f'project = {project_key} AND '
+                f'status = "Triage" '
+                f'ORDER BY created DESC'
+            ),
+            'todo': (
+                f'project = {project_key} AND '
+                f'status = "To Do" '
+                f'ORDER BY created DESC'
+            ),
+            'in_progress': (
+                f'project = {project_key} AND '
+                f'status = "In Progress" '
+                f'ORDER BY updated DESC'
+            ),
+            'waiting_for_customer': (
+                f'project = {project_key} AND '
+                f'status = "Waiting for customer" '
+                f'ORDER BY updated ASC'
+            ),
+            'recently_closed': (
+                f'project = {project_key} AND '
+                f'status in (Done, Closed, Resolved) AND '
+                f'resolved >= -1d '
+                f'ORDER BY resolved DESC'
+            ),
+            'comment_activity': (
+                f'project = {project_key} AND '
+                f'status not in (Done, Cancelled, Resolved, Closed, Triage) '
+                f'ORDER BY updated ASC'
+            ),
+            'triage_buckets': (
+                f'project = {project_key} AND '
+                f'(status not in (Done, Cancelled, Resolved, Closed) OR '
+                f'(status in (Done, Closed, Resolved) AND resolved >= -1d))'
+            )
+        }
+        
         self.staleness_threshold = timedelta(days=1)
         self.recently_closed_window = timedelta(days=1)
         self._team_members = None  # Cache for team members
-        self._team_member_account_ids = None  # Cache for account IDs
+        self._team_member_account_ids = None  # Frozenset of team member account IDs, for lookups
+        self.page_size = page_size
+        self.max_workers = 16  # Concurrent per-issue requests (comment checks)
+        self._request_slots = threading.BoundedSemaphore(16)  # Max requests in flight
+        self._comment_cache = {}  # (issue key, updated) -> unacknowledged comments
         
         # Look up team ID from team name if provided
         if self.team_name:
             self.team_id = self._lookup_team_id(self.team_name)
     
+    def close(self) -> None:
+        """Close the HTTP session and its pooled connections"""
+        self.session.close()
+    
+    def __enter__(self) -> 'JiraBoardWatcher':
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def _request_with_retry(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request on the shared session, retrying when Jira is rate limiting
+        
+        429 and 503 responses are retried up to MAX_RETRIES times, waiting for
+        the server's Retry-After or exponential backoff, whichever is longer.
+        At most 16 requests are in flight across threads.
+        
+        Args:
+            method: HTTP method ('GET', 'POST', ...)
+            url: Request URL
+            **kwargs: Passed through to requests.Session.request
+            
+        Returns:
+            The final response (possibly still a 429/503 once retries run out)
+        """
+        for attempt in range(self.MAX_RETRIES + 1):
+            with self._request_slots:
+                response = self.session.request(method, url, **kwargs)
+            
+            if response.status_code not in (429, 503) or attempt == self.MAX_RETRIES:
+                return response
+            
+            try:
+                retry_after = float(response.headers.get('Retry-After', 1))
+            except ValueError:  # HTTP-date form; fall back to the backoff
+                retry_after = 0
+            delay = max(retry_after, 2 ** attempt)
+            print(f"[WARN] Jira returned {response.status_code}, retrying in {delay:.0f}s", file=sys.stderr)
+            time.sleep(delay)
+        
+        return response
+    
     def _lookup_team_id(self, team_name: str) -> Optional[str]:
         """
         Look up team ID from team name using project roles
@@ -103,7 +433,7 @@ class JiraBoardWatcher:
         url = "https://api.atlassian.com/oauth/token/accessible-resources"
         
         try:
-            response = requests.get(url, auth=self.auth, headers=self.headers)
+            response = self._request_with_retry('GET', url)
             
             # If we get 401, the API token doesn't work for this endpoint
             # This is expected - Teams API requires OAuth, not API token
@@ -113,7 +443,7 @@ class JiraBoardWatcher:
             
             response.raise_for_status()
             
-            resources = response.json()
+            resources = _response_json(response)
             if resources:
                 # Get the first resource's ID (usually the cloud ID)
                 cloud_id = resources[0].get('id')
@@ -173,10 +503,10 @@ class JiraBoardWatcher:
                 if cursor:
                     payload['cursor'] = cursor
                 
-                response = requests.post(url, auth=self.auth, headers=self.headers, json=payload)
+                response = self._request_with_retry('POST', url, json=payload)
                 response.raise_for_status()
                 
-                data = response.json()
+                data = _response_json(response)
                 members = data.get('entities', [])
                 
                 for member in members:
@@ -220,68 +550,33 @@ class JiraBoardWatcher:
         url = f"{self.jira_url}/rest/api/3/project/{project_key}/role"
         all_account_ids = set()  # Use set to avoid duplicates
         
-        # Define which roles to include (core team roles)
-        team_roles = ['Member', 'Administrator']
-        
         try:
             print(f"[API] Fetching project roles for: {project_key}", file=sys.stderr)
-            response = requests.get(url, auth=self.auth, headers=self.headers)
+            response = self._request_with_retry('GET', url)
             response.raise_for_status()
             
-            roles = response.json()
+            roles = _response_json(response)
             print(f"[API] Found {len(roles)} roles in project", file=sys.stderr)
             
-            # Phase 2: Fetch members only from team roles (Member, Administrator)
-            for role_name, role_url in roles.items():
-                # Skip roles that aren't part of the core team
-                if role_name not in team_roles:
-                    continue
-                
-                try:
-                    print(f"[API] Fetching members for role: {role_name}", file=sys.stderr)
-                    role_response = requests.get(role_url, auth=self.auth, headers=self.headers)
-                    role_response.raise_for_status()
-                    
-                    role_data = role_response.json()
-                    actors = role_data.get('actors', [])
-                    
-                    for actor in actors:
-                        # Only include users directly assigned to roles
-                        # Exclude group-based assignments as they may include other teams
-                        actor_type = actor.get('type')
-                        if actor_type == 'atlassian-user-role-actor':
-                            account_id = actor.get('actorUser', {}).get('accountId')
-                            if account_id:
-                                all_account_ids.add(account_id)
-                        # Skip atlassian-group-role-actor to exclude users from other teams
-                    
-                except requests.exceptions.RequestException as e:
-                    print(f"[WARN] Failed to fetch role {role_name}: {e}", file=sys.stderr)
+            # Phase 2: Fetch members only from team roles (Member, Administrator).
+            # The role lookups are independent, so they run concurrently.
+            team_role_names = [name for name in roles if name in _TEAM_ROLES]
+            if team_role_names:
+                with ThreadPoolExecutor(max_workers=len(team_role_names)) as executor:
+                    role_members = executor.map(
+                        self._get_role_members,
+                        team_role_names,
+                        [roles[name] for name in team_role_names]
+                    )
+                    for account_ids in role_members:
+                        all_account_ids.update(account_ids)
             
             print(f"[API] Found {len(all_account_ids)} total accounts, filtering out bots/apps...", file=sys.stderr)
             
             # Phase 3: Filter out bots/apps, keep only real users
             # Real users have email addresses, bots/apps don't
-            real_users = []
-            app_count = 0
-            
-            for account_id in all_account_ids:
-                user_url = f"{self.jira_url}/rest/api/3/user?accountId={account_id}"
-                try:
-                    user_response = requests.get(user_url, auth=self.auth, headers=self.headers)
-                    if user_response.status_code == 200:
-                        user = user_response.json()
-                        email = user.get('emailAddress')
-                        
-                        # Only include users with email addresses (real people)
-                        # Bots/apps don't have email addresses
-                        if email:
-                            real_users.append(account_id)
-                        else:
-                            app_count += 1
-                except requests.exceptions.RequestException:
-                    # If we can't fetch user details, exclude them to be safe
-                    app_count += 1
+            real_users = self._bulk_lookup_users(all_account_ids)
+            app_count = len(all_account_ids) - len(real_users)
             
             self._team_members = real_users
             print(f"[API] Found {len(self._team_members)} real users (filtered out {app_count} bots/apps)", file=sys.stderr)
@@ -294,6 +589,79 @@ class JiraBoardWatcher:
             self._team_members = []
             return self._team_members
     
+    def _get_role_members(self, role_name: str, role_url: str) -> List[str]:
+        """
+        Get account IDs of users assigned directly to a project role
+        
+        Args:
+            role_name: Name of the role (for logging)
+            role_url: The role's REST URL, as listed by the project role endpoint
+            
+        Returns:
+            List of account IDs (empty if the role can't be fetched)
+        """
+        account_ids = []
+        
+        try:
+            print(f"[API] Fetching members for role: {role_name}", file=sys.stderr)
+            role_response = self._request_with_retry('GET', role_url)
+            role_response.raise_for_status()
+            
+            role_data = _response_json(role_response)
+            actors = role_data.get('actors', [])
+            
+            for actor in actors:
+                # Only include users directly assigned to roles
+                # Exclude group-based assignments as they may include other teams
+                actor_type = actor.get('type')
+                if actor_type == 'atlassian-user-role-actor':
+                    account_id = actor.get('actorUser', {}).get('accountId')
+                    if account_id:
+                        account_ids.append(account_id)
+                # Skip atlassian-group-role-actor to exclude users from other teams
+            
+        except requests.exceptions.RequestException as e:
+            print(f"[WARN] Failed to fetch role {role_name}: {e}", file=sys.stderr)
+        
+        return account_ids
+    
+    def _bulk_lookup_users(self, account_ids) -> List[str]:
+        """
+        Return the account IDs that belong to real users (those with an email address)
+        
+        Looks users up in chunks via /user/bulk instead of one request per user.
+        Accounts that can't be fetched are excluded to be safe.
+        
+        Args:
+            account_ids: Iterable of Jira account IDs
+            
+        Returns:
+            List of account IDs for users with an email address
+        """
+        url = f"{self.jira_url}/rest/api/3/user/bulk"
+        real_users = []
+        ids = iter(account_ids)
+        
+        # Chunked to keep the repeated accountId params well under URL length limits
+        while True:
+            chunk = list(islice(ids, 90))
+            if not chunk:
+                break
+            
+            params = [('accountId', account_id) for account_id in chunk]
+            params.append(('maxResults', len(chunk)))
+            try:
+                response = self._request_with_retry('GET', url, params=params)
+                response.raise_for_status()
+                
+                for user in _response_json(response).get('values', []):
+                    if user.get('emailAddress'):
+                        real_users.append(user['accountId'])
+            except requests.exceptions.RequestException as e:
+                print(f"[WARN] Failed to look up {len(chunk)} users: {e}", file=sys.stderr)
+        
+        return real_users
+    
     def _get_group_members(self, group_name: str) -> List[str]:
         """
         Get list of account IDs for members of a Jira group
@@ -312,10 +680,10 @@ class JiraBoardWatcher:
             print(f"[API] Fetching members for group: {group_name}", file=sys.stderr)
             
             while True:
-                response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
+                response = self._request_with_retry('GET', url, params=params)
                 response.raise_for_status()
                 
-                data = response.json()
+                data = _response_json(response)
                 members = data.get('values', [])
                 
                 for member in members:
@@ -350,17 +718,24 @@ class JiraBoardWatcher:
         Returns:
             True if the account is a team member, False otherwise
         """
-        team_members = self._get_team_members()
-        return account_id in team_members
+        if self._team_member_account_ids is None:
+            self._team_member_account_ids = frozenset(self._get_team_members())
+        return account_id in self._team_member_account_ids
     
-    def _search_jira(self, jql: str, fields: Optional[List[str]] = None, max_results: int = 100) -> List[Dict[str, Any]]:
+    def _search_jira(self, jql: str, fields: Optional[List[str]] = None, max_results: Optional[int] = None,
+                     max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
         """
-        Execute a JQL search against Jira API
+        Execute a JQL search against Jira API, following nextPageToken across pages
+        
+        Pages are fetched one after another: each page's token comes from the
+        previous response, and /search/jql has no startAt offsets or total to
+        split the work across concurrent requests.
         
         Args:
             jql: JQL query string
-            fields: List of fields to return (None = all fields)
-            max_results: Maximum number of results
+            fields: List of fields to return (None = the fields the report reads)
+            max_results: Page size requested per call (default: self.page_size)
+            max_pages: Maximum number of pages to fetch (default: MAX_SEARCH_PAGES)
             
         Returns:
             List of issues matching the query
@@ -369,17 +744,29 @@ class JiraBoardWatcher:
         
         params = {
             'jql': jql,
-            'maxResults': max_results,
-            'fields': ','.join(fields) if fields else '*all'
+            'maxResults': max_results or self.page_size,
+            'fields': ','.join(fields or _REPORT_FIELDS)
         }
+        issues = []
+        max_pages = max_pages or self.MAX_SEARCH_PAGES
         
         try:
             print(f"[API] Searching Jira with JQL: {jql}", file=sys.stderr)
-            response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
-            response.raise_for_status()
+            for _ in range(max_pages):
+                response = self._request_with_retry('GET', url, params=params)
+                response.raise_for_status()
+                
+                data = _response_json(response)
+                issues.extend(data.get('issues', []))
+                
+                next_page_token = data.get('nextPageToken')
+                if data.get('isLast', True) or not next_page_token:
+                    break
+                params['nextPageToken'] = next_page_token
+            else:
+                print(f"[WARN] Stopped after {max_pages} pages ({len(issues)} issues); results are truncated. "
+                      f"Raise JiraBoardWatcher.MAX_SEARCH_PAGES if the board has grown", file=sys.stderr)
             
-            data = response.json()
-            issues = data.get('issues', [])
             print(f"[API] Found {len(issues)} issues", file=sys.stderr)
             return issues
             
@@ -395,13 +782,7 @@ class JiraBoardWatcher:
         
         JQL: project = CDPSUPPORT AND status = "Triage" ORDER BY created DESC
         """
-        jql = (
-            f'project = {self.project_key} AND '
-            f'status = "Triage" '
-            f'ORDER BY created DESC'
-        )
-        
-        return self._search_jira(jql)
+        return self._search_jira(self._jql['triage'])
     
     def get_todo_items(self) -> List[Dict[str, Any]]:
         """
@@ -409,13 +790,7 @@ class JiraBoardWatcher:
         
         JQL: project = CDPSUPPORT AND status = "To Do" ORDER BY created DESC
         """
-        jql = (
-            f'project = {self.project_key} AND '
-            f'status = "To Do" '
-            f'ORDER BY created DESC'
-        )
-        
-        return self._search_jira(jql)
+        return self._search_jira(self._jql['todo'])
     
     def get_in_progress_items(self) -> List[Dict[str, Any]]:
         """
@@ -423,13 +798,7 @@ class JiraBoardWatcher:
         
         JQL: project = CDPSUPPORT AND status = "In Progress" ORDER BY updated DESC
         """
-        jql = (
-            f'project = {self.project_key} AND '
-            f'status = "In Progress" '
-            f'ORDER BY updated DESC'
-        )
-        
-        return self._search_jira(jql)
+        return self._search_jira(self._jql['in_progress'])
     
     def get_waiting_for_customer_items(self) -> List[Dict[str, Any]]:
         """
@@ -437,29 +806,30 @@ class JiraBoardWatcher:
         
         JQL: project = CDPSUPPORT AND status = "Waiting for customer" ORDER BY updated ASC
         """
-        jql = (
-            f'project = {self.project_key} AND '
-            f'status = "Waiting for customer" '
-            f'ORDER BY updated ASC'
-        )
-        
-        return self._search_jira(jql)
+        return self._search_jira(self._jql['waiting_for_customer'])
     
-    def get_stale_items(self) -> List[Dict[str, Any]]:
+    def get_stale_items(self, in_progress_items: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """
-        Get in-progress items not updated in >1 day
+        Get in-progress items not updated within staleness_threshold (1 day)
         
-        JQL: project = CDPSUPPORT AND status = "In Progress" AND 
-             updated < -1d ORDER BY updated ASC
+        Filters the in-progress items client-side instead of running a second,
+        nearly identical search (project = CDPSUPPORT AND status = "In Progress"
+        AND updated < -1d).
+        
+        Args:
+            in_progress_items: Already-fetched in-progress items (fetched if None)
+            
+        Returns:
+            Stale items ordered by updated ascending
         """
-        jql = (
-            f'project = {self.project_key} AND '
-            f'status = "In Progress" AND '
-            f'updated < -1d '
-            f'ORDER BY updated ASC'
-        )
+        if in_progress_items is None:
+            in_progress_items = self.get_in_progress_items()
         
-        return self._search_jira(jql)
+        stale_before = datetime.now(timezone.utc) - self.staleness_threshold
+        return _sort_issues(
+            [i for i in in_progress_items if _parse_jira_ts(i['fields']['updated']) < stale_before],
+            'updated'
+        )
     
     def get_recently_closed_items(self) -> List[Dict[str, Any]]:
         """
@@ -468,14 +838,7 @@ class JiraBoardWatcher:
         JQL: project = CDPSUPPORT AND status = Done AND 
              resolved >= -1d ORDER BY resolved DESC
         """
-        jql = (
-            f'project = {self.project_key} AND '
-            f'status in (Done, Closed, Resolved) AND '
-            f'resolved >= -1d '
-            f'ORDER BY resolved DESC'
-        )
-        
-        return self._search_jira(jql)
+        return self._search_jira(self._jql['recently_closed'])
     
     def get_items_by_comment_activity(self) -> List[Dict[str, Any]]:
         """
@@ -485,56 +848,80 @@ class JiraBoardWatcher:
         
         JQL: project = CDPSUPPORT AND status not in (Done, Cancelled, Resolved, Closed, Triage)
         """
-        jql = (
-            f'project = {self.project_key} AND '
-            f'status not in (Done, Cancelled, Resolved, Closed, Triage) '
-            f'ORDER BY updated ASC'
-        )
         
         # Get issues with comment field
         fields = ['summary', 'status', 'assignee', 'created', 'updated', 'comment']
-        issues = self._search_jira(jql, fields=fields, max_results=200)
+        issues = self._search_jira(self._jql['comment_activity'], fields=fields)
+        
+        return self._analyze_comment_activity(issues)
+    
+    def _analyze_comment_activity(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Summarize the comment activity of issues (which must include the comment field)
         
+        Args:
+            issues: Issues ordered by updated ascending
+            
+        Returns:
+            Analysis per issue, sorted by least recent comment activity first
+        """
         items_with_analysis = []
+        now = datetime.now(timezone.utc)
+        
+        # Search results carry only the oldest comments of a long thread; fetch
+        # the newest comment and real count of each such issue concurrently
+        truncated_keys = [issue.get('key', 'N/A') for issue in issues if not self._has_all_comments(issue)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            latest_comments = dict(zip(truncated_keys, executor.map(self._fetch_last_comment, truncated_keys)))
         
         for issue in issues:
             key = issue.get('key', 'N/A')
-            summary = issue.get('fields', {}).get('summary', 'No summary')
-            status = issue.get('fields', {}).get('status', {}).get('name', 'Unknown')
-            assignee = issue.get('fields', {}).get('assignee', {})
-            assignee_name = assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'
-            created = issue.get('fields', {}).get('created', '')
-            updated = issue.get('fields', {}).get('updated', '')
+            f = issue.get('fields') or _EMPTY
+            summary = f.get('summary', 'No summary')
+            status = (f.get('status') or _EMPTY).get('name', 'Unknown')
+            assignee_name = (f.get('assignee') or _EMPTY).get('displayName', 'Unassigned')
+            created = f.get('created', '')
+            updated = f.get('updated', '')
             
-            comments = issue.get('fields', {}).get('comment', {}).get('comments', [])
+            comment_field = f.get('comment') or _EMPTY
+            comments = comment_field.get('comments', [])
+            comment_count = len(comments)
+            last_comment = comments[-1] if comments else None
+            
+            latest = latest_comments.get(key)
+            if latest:
+                last_comment, comment_count = latest
             
             last_comment_date = None
             last_comment_author = None
             last_comment_author_account_id = None
             last_comment_by_team = None
-            comment_count = len(comments)
+            last_comment_tag = ""
             days_since_activity = None
+            sort_ts = -1.0  # No comments sort first
             
-            if comments:
+            if last_comment is not None:
                 # Get the most recent comment
-                last_comment = comments[-1]
                 last_comment_date = last_comment.get('created', '')
-                last_comment_author = last_comment.get('author', {}).get('displayName', 'Unknown')
-                last_comment_author_account_id = last_comment.get('author', {}).get('accountId', '')
+                author = last_comment.get('author') or _EMPTY
+                last_comment_author = author.get('displayName', 'Unknown')
+                last_comment_author_account_id = author.get('accountId', '')
                 
                 # Check if last comment was by a team member
                 if last_comment_author_account_id:
                     last_comment_by_team = self._is_team_member(last_comment_author_account_id)
+                    last_comment_tag = " 👥 [TEAM]" if last_comment_by_team else " 👤 [CUSTOMER]"
                 
                 # Calculate days since last comment
+                sort_ts = 0.0
                 if last_comment_date:
-                    last_comment_dt = datetime.fromisoformat(last_comment_date.replace('Z', '+00:00'))
-                    days_since_activity = (datetime.now(last_comment_dt.tzinfo) - last_comment_dt).days
+                    last_comment_dt = _parse_jira_ts(last_comment_date)
+                    days_since_activity = (now - last_comment_dt).days
+                    sort_ts = last_comment_dt.timestamp()
             else:
                 # No comments - calculate days since created
                 if created:
-                    created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                    days_since_activity = (datetime.now(created_dt.tzinfo) - created_dt).days
+                    days_since_activity = (now - _parse_jira_ts(created)).days
             
             items_with_analysis.append({
                 'key': key,
@@ -547,62 +934,138 @@ class JiraBoardWatcher:
                 'last_comment_date': last_comment_date,
                 'last_comment_author': last_comment_author,
                 'last_comment_by_team': last_comment_by_team,
-                'days_since_activity': days_since_activity
+                'days_since_activity': days_since_activity,
+                'sort_ts': sort_ts,
+                # Display forms used by format_report
+                'summary_trunc': summary[:60],
+                'created_date': created[:10],
+                'last_comment_date_short': last_comment_date[:10] if last_comment_date else last_comment_date,
+                'last_comment_tag': last_comment_tag
             })
         
         # Sort by last comment date (oldest first), with no-comment items first
-        def sort_key(item):
-            if item['last_comment_date'] is None:
-                return ('0', '')  # No comments go first
-            return ('1', item['last_comment_date'])
-        
-        items_with_analysis.sort(key=sort_key)
+        items_with_analysis.sort(key=lambda item: item['sort_ts'])
         
         return items_with_analysis
     
-    def check_for_customer_comments(self, issue_key: str) -> List[Dict[str, Any]]:
+    def _fetch_all_triage_buckets(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch every issue the triage report needs with one search and bucket them
+        
+        Replaces one search per report section. Buckets match what the get_*
+        methods return, including their JQL ordering.
+        
+        JQL: project = CDPSUPPORT AND (status not in (Done, Cancelled, Resolved, Closed)
+             OR (status in (Done, Closed, Resolved) AND resolved >= -1d))
+        
+        Returns:
+            Dict with 'triage', 'todo', 'in_progress', 'waiting_for_customer',
+            'stale', 'recently_closed' and 'comment_activity' issue lists
+        """
+        fields = [*_REPORT_FIELDS, 'comment']
+        issues = self._search_jira(self._jql['triage_buckets'], fields=fields)
+        
+        by_status = {}
+        for issue in issues:
+            status = (issue['fields'].get('status') or _EMPTY).get('name', '').lower()
+            by_status.setdefault(status, []).append(issue)
+        
+        closed_statuses = ('done', 'closed', 'resolved')
+        in_progress = _sort_issues(by_status.get('in progress', []), 'updated', descending=True)
+        
+        return {
+            'triage': _sort_issues(by_status.get('triage', []), 'created', descending=True),
+            'todo': _sort_issues(by_status.get('to do', []), 'created', descending=True),
+            'in_progress': in_progress,
+            'waiting_for_customer': _sort_issues(by_status.get('waiting for customer', []), 'updated'),
+            'stale': self.get_stale_items(in_progress),
+            'recently_closed': _sort_issues(
+                [i for s in closed_statuses for i in by_status.get(s, [])],
+                'resolutiondate', descending=True
+            ),
+            'comment_activity': _sort_issues(
+                [i for s, group in by_status.items()
+                 if s not in closed_statuses and s not in ('cancelled', 'triage') for i in group],
+                'updated'
+            ),
+        }
+    
+    def _fetch_last_comment(self, issue_key: str) -> Optional[Tuple[Dict[str, Any], int]]:
+        """
+        Fetch an issue's most recent comment and its total comment count
+        
+        Args:
+            issue_key: The Jira issue key (e.g., 'CDPSUPPORT-123')
+            
+        Returns:
+            (last comment, comment count), or None if the request failed or the
+            issue has no comments
+        """
+        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}/comment"
+        params = {'orderBy': '-created', 'maxResults': 1}
+        
+        try:
+            response = self._request_with_retry('GET', url, params=params)
+            response.raise_for_status()
+            data = _response_json(response)
+        except requests.exceptions.RequestException as e:
+            print(f"[ERROR] Failed to get last comment for {issue_key}: {e}", file=sys.stderr)
+            return None
+        
+        comments = data.get('comments', [])
+        if not comments:
+            return None
+        return comments[0], data.get('total', len(comments))
+    
+    def _has_all_comments(self, issue: Dict[str, Any]) -> bool:
+        """Whether a searched issue's inline comment field holds its whole thread"""
+        comment = (issue.get('fields') or _EMPTY).get('comment')
+        if not comment:
+            return False
+        return comment.get('total', 0) <= len(comment.get('comments', []))
+    
+    def check_for_customer_comments(self, issue_key: str, updated: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Check if an issue has unacknowledged customer comments
         
+        Results are cached for the life of the watcher when the issue's updated
+        timestamp is given, since an issue's comments can't change without
+        bumping it.
+        
         Args:
             issue_key: The Jira issue key (e.g., 'CDPSUPPORT-123')
+            updated: The issue's 'updated' field, if known
             
         Returns:
             List of unacknowledged customer comments
         """
-        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}"
-        params = {'expand': 'comments'}
+        cache_key = (issue_key, updated)
+        if updated and cache_key in self._comment_cache:
+            return self._comment_cache[cache_key]
+        
+        # The comment endpoint returns just the comments, not the whole issue
+        url = f"{self.jira_url}/rest/api/3/issue/{issue_key}/comment"
+        params = {'startAt': 0, 'maxResults': 100}
+        comments = []
         
         try:
             print(f"[API] Checking issue {issue_key} for customer comments", file=sys.stderr)
-            response = requests.get(url, auth=self.auth, headers=self.headers, params=params)
-            response.raise_for_status()
+            while True:
+                response = self._request_with_retry('GET', url, params=params)
+                response.raise_for_status()
+                
+                data = _response_json(response)
+                page = data.get('comments', [])
+                comments.extend(page)
+                
+                if not page or len(comments) >= data.get('total', 0):
+                    break
+                params['startAt'] = len(comments)
             
-            data = response.json()
-            comments = data.get('fields', {}).get('comment', {}).get('comments', [])
-            
-            # Simple heuristic: look for comments from external users (not @cirium.com)
-            # that don't have a reply from internal team
-            unacknowledged = []
-            for comment in comments:
-                author_email = comment.get('author', {}).get('emailAddress', '')
-                if author_email and not author_email.endswith('@cirium.com'):
-                    # Check if there's a later comment from internal team
-                    comment_created = datetime.fromisoformat(comment.get('created', '').replace('Z', '+00:00'))
-                    has_reply = False
-                    
-                    for reply in comments:
-                        reply_author_email = reply.get('author', {}).get('emailAddress', '')
-                        reply_created = datetime.fromisoformat(reply.get('created', '').replace('Z', '+00:00'))
-                        
-                        if (reply_author_email.endswith('@cirium.com') and 
-                            reply_created > comment_created):
-                            has_reply = True
-                            break
-                    
-                    if not has_reply:
-                        unacknowledged.append(comment)
+            unacknowledged = _scan_unack(comments)
             
+            if updated:
+                self._comment_cache[cache_key] = unacknowledged
             return unacknowledged
             
         except requests.exceptions.RequestException as e:
@@ -618,24 +1081,56 @@ class JiraBoardWatcher:
         """
         print("[INFO] Generating triage report...", file=sys.stderr)
         
-        triage_items = self.get_triage_items()
-        todo_items = self.get_todo_items()
-        in_progress_items = self.get_in_progress_items()
-        waiting_for_customer_items = self.get_waiting_for_customer_items()
-        stale_items = self.get_stale_items()
-        recently_closed = self.get_recently_closed_items()
-        items_by_comment_activity = self.get_items_by_comment_activity()
+        buckets = self._fetch_all_triage_buckets()
+        triage_items = buckets['triage']
+        todo_items = buckets['todo']
+        in_progress_items = buckets['in_progress']
+        waiting_for_customer_items = buckets['waiting_for_customer']
+        stale_items = buckets['stale']
+        recently_closed = buckets['recently_closed']
+        items_by_comment_activity = self._analyze_comment_activity(buckets['comment_activity'])
+        
+        # Check each in-progress item for unacknowledged customer comments.
+        # The search already returned their comments; only issues whose comment
+        # list was truncated need their own request. Those run concurrently, and
+        # map() keeps the results in order.
+        truncated = [item for item in in_progress_items if not self._has_all_comments(item)]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            fetched = dict(zip(
+                [item.get('key', '') for item in truncated],
+                executor.map(
+                    self.check_for_customer_comments,
+                    [item.get('key', '') for item in truncated],
+                    [(item.get('fields') or _EMPTY).get('updated') for item in truncated]
+                )
+            ))
         
-        # Check each in-progress item for unacknowledged customer comments
         unacknowledged = []
         for item in in_progress_items:
-            comments = self.check_for_customer_comments(item.get('key', ''))
+            key = item.get('key', '')
+            if key in fetched:
+                comments = fetched[key]
+            else:
+                comments = _scan_unack(item['fields']['comment']['comments'])
             if comments:
                 unacknowledged.append({
                     'issue': item,
                     'comments': comments
                 })
         
+        # Items with no comments or >3 days since the last one, plus summary counts
+        items_needing_attention = []
+        no_comment_count = 0
+        customer_last_comment_count = 0
+        for item in items_by_comment_activity:
+            if item['comment_count'] == 0:
+                no_comment_count += 1
+                items_needing_attention.append(item)
+            elif item['days_since_activity'] and item['days_since_activity'] > 3:
+                items_needing_attention.append(item)
+            if item['last_comment_by_team'] is False:
+                customer_last_comment_count += 1
+        
         return TriageReport(
             triage_items=triage_items,
             todo_items=todo_items,
@@ -644,7 +1139,11 @@ class JiraBoardWatcher:
             stale_items=stale_items,
             unacknowledged_comments=unacknowledged,
             recently_closed=recently_closed,
-            items_by_comment_activity=items_by_comment_activity
+            items_by_comment_activity=items_by_comment_activity,
+            items_needing_attention=items_needing_attention,
+            no_comment_count=no_comment_count,
+            customer_last_comment_count=customer_last_comment_count,
+            needs_action=bool(stale_items or unacknowledged or triage_items)
         )
     
     def format_report(self, report: TriageReport) -> str:
@@ -657,134 +1156,58 @@ class JiraBoardWatcher:
         Returns:
             Markdown-formatted report string
         """
+        return "\n".join(self.format_report_lines(report))
+    
+    def format_report_lines(self, report: TriageReport) -> List[str]:
+        """
+        Format the triage report as a list of markdown chunks, without newlines
+        
+        Joining them with newlines gives format_report's string. Writing them
+        out one by one avoids building that string for large boards.
+        
+        Args:
+            report: The TriageReport to format
+            
+        Returns:
+            Report chunks in order (a chunk may span several lines)
+        """
         output = []
         output.append("# 🎯 Daily Triage Report")
         output.append(f"\n**Generated:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
         output.append(f"\n**Board:** {self.project_key} (Board #{self.board_id})\n")
         
-        # Items in Triage status
-        output.append("## � Triage Status (Need Review & Sizing)")
-        if report.triage_items:
-            output.append(f"\n**Count:** {len(report.triage_items)} items need triage\n")
-            for item in report.triage_items:
-                key = item.get('key', 'N/A')
-                summary = item.get('fields', {}).get('summary', 'No summary')
-                created = item.get('fields', {}).get('created', 'N/A')
-                assignee = item.get('fields', {}).get('assignee', {})
-                assignee_name = assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'
-                output.append(f"- **{key}**: {summary}")
-                output.append(f"  - Created: {created}")
-                output.append(f"  - Assignee: {assignee_name}")
-                output.append(f"  - Link: https://cirium.atlassian.net/browse/{key}")
-        else:
-            output.append("\n✅ No items in triage!\n")
-        
-        # Items in To Do status
-        output.append("\n## 📋 To Do Status (Ready to Work)")
-        if report.todo_items:
-            output.append(f"\n**Count:** {len(report.todo_items)} items ready to be picked up\n")
-            for item in report.todo_items:
-                key = item.get('key', 'N/A')
-                summary = item.get('fields', {}).get('summary', 'No summary')
-                created = item.get('fields', {}).get('created', 'N/A')
-                assignee = item.get('fields', {}).get('assignee', {})
-                assignee_name = assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'
-                output.append(f"- **{key}**: {summary}")
-                output.append(f"  - Created: {created}")
-                output.append(f"  - Assignee: {assignee_name}")
-                output.append(f"  - Link: https://cirium.atlassian.net/browse/{key}")
-        else:
-            output.append("\n✅ No items in to do!\n")
-        
-        # In-progress items
-        output.append("\n## 🚧 In Progress Status")
-        if report.in_progress_items:
-            output.append(f"\n**Count:** {len(report.in_progress_items)} items currently active\n")
-            for item in report.in_progress_items:
-                key = item.get('key', 'N/A')
-                summary = item.get('fields', {}).get('summary', 'No summary')
-                assignee = item.get('fields', {}).get('assignee', {})
-                assignee_name = assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'
-                status = item.get('fields', {}).get('status', {}).get('name', 'Unknown')
-                updated = item.get('fields', {}).get('updated', 'N/A')
-                
-                output.append(f"- **{key}**: {summary}")
-                output.append(f"  - Status: {status}")
-                output.append(f"  - Assignee: {assignee_name}")
-                output.append(f"  - Last Updated: {updated}")
-                output.append(f"  - Link: https://cirium.atlassian.net/browse/{key}")
-        else:
-            output.append("\n✅ No items in progress.\n")
-        
-        # Waiting for customer items
-        output.append("\n## ⏳ Waiting for Customer Status")
-        if report.waiting_for_customer_items:
-            output.append(f"\n**Count:** {len(report.waiting_for_customer_items)} items waiting for customer response\n")
-            for item in report.waiting_for_customer_items:
-                key = item.get('key', 'N/A')
-                summary = item.get('fields', {}).get('summary', 'No summary')
-                assignee = item.get('fields', {}).get('assignee', {})
-                assignee_name = assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'
-                updated = item.get('fields', {}).get('updated', 'N/A')
-                
-                output.append(f"- **{key}**: {summary}")
-                output.append(f"  - Assignee: {assignee_name}")
-                output.append(f"  - Last Updated: {updated}")
-                output.append(f"  - Link: https://cirium.atlassian.net/browse/{key}")
-        else:
-            output.append("\n✅ No items waiting for customer.\n")
-        
-        # Stale items (ALERT!)
-        output.append("\n## ⚠️  Stale Items (Not Updated >1 Day)")
-        if report.stale_items:
-            output.append(f"\n**Count:** {len(report.stale_items)} items may be blocked!\n")
-            for item in report.stale_items:
-                key = item.get('key', 'N/A')
-                summary = item.get('fields', {}).get('summary', 'No summary')
-                assignee = item.get('fields', {}).get('assignee', {})
-                assignee_name = assignee.get('displayName', 'Unassigned') if assignee else 'Unassigned'
-                updated = item.get('fields', {}).get('updated', 'N/A')
-                
-                output.append(f"- **🚨 {key}**: {summary}")
-                output.append(f"  - Assignee: {assignee_name}")
-                output.append(f"  - Last Updated: {updated}")
-                output.append(f"  - Link: https://cirium.atlassian.net/browse/{key}")
-        else:
-            output.append("\n✅ No stale items!\n")
-        
-        # Unacknowledged customer comments
-        output.append("\n## 💬 Unacknowledged Customer Comments")
-        if report.unacknowledged_comments:
-            output.append(f"\n**Count:** {len(report.unacknowledged_comments)} items need attention!\n")
-            for item in report.unacknowledged_comments:
-                issue = item.get('issue', {})
-                key = issue.get('key', 'N/A')
-                summary = issue.get('fields', {}).get('summary', 'No summary')
-                comment_count = len(item.get('comments', []))
-                
-                output.append(f"- **{key}**: {summary}")
-                output.append(f"  - Unacknowledged comments: {comment_count}")
-                output.append(f"  - Link: https://cirium.atlassian.net/browse/{key}")
-        else:
-            output.append("\n✅ All customer comments acknowledged!\n")
-        
-        # Recently closed items (CELEBRATION!)
-        output.append("\n## 🎉 Recently Closed Items (Celebrate!)")
-        if report.recently_closed:
-            output.append(f"\n**Count:** {len(report.recently_closed)} items completed!\n")
-            for item in report.recently_closed:
-                key = item.get('key', 'N/A')
-                summary = item.get('fields', {}).get('summary', 'No summary')
-                assignee = item.get('fields', {}).get('assignee', {})
-                assignee_name = assignee.get('displayName', 'Team') if assignee else 'Team'
-                resolved = item.get('fields', {}).get('resolutiondate', 'N/A')
-                
-                output.append(f"- **{key}**: {summary}")
-                output.append(f"  - Resolved by: {assignee_name}")
-                output.append(f"  - Resolved: {resolved}")
-                output.append(f"  - Link: https://cirium.atlassian.net/browse/{key}")
-        else:
-            output.append("\n📊 No items closed recently.\n")
+        # One row per issue list: heading, items, count text, empty-list message,
+        # per-issue template and a function giving each item's template fields
+        sections = [
+            ("## � Triage Status (Need Review & Sizing)", report.triage_items,
+             "items need triage", "✅ No items in triage!", _CREATED_BLOCK, _display_fields),
+            ("\n## 📋 To Do Status (Ready to Work)", report.todo_items,
+             "items ready to be picked up", "✅ No items in to do!", _CREATED_BLOCK, _display_fields),
+            ("\n## 🚧 In Progress Status", report.in_progress_items,
+             "items currently active", "✅ No items in progress.", _IN_PROGRESS_BLOCK, _display_fields),
+            ("\n## ⏳ Waiting for Customer Status", report.waiting_for_customer_items,
+             "items waiting for customer response", "✅ No items waiting for customer.",
+             _UPDATED_BLOCK, _display_fields),
+            # Stale items (ALERT!)
+            ("\n## ⚠️  Stale Items (Not Updated >1 Day)", report.stale_items,
+             "items may be blocked!", "✅ No stale items!", _STALE_BLOCK, _display_fields),
+            ("\n## 💬 Unacknowledged Customer Comments", report.unacknowledged_comments,
+             "items need attention!", "✅ All customer comments acknowledged!", _UNACK_BLOCK,
+             lambda item: _display_fields(item.get('issue') or _EMPTY,
+                                          comment_count=len(item.get('comments', [])))),
+            # Recently closed items (CELEBRATION!)
+            ("\n## 🎉 Recently Closed Items (Celebrate!)", report.recently_closed,
+             "items completed!", "📊 No items closed recently.", _CLOSED_BLOCK,
+             lambda item: _display_fields(item, unassigned='Team')),
+        ]
+        
+        for heading, items, count_text, empty_msg, template, fields_of in sections:
+            output.append(heading)
+            if items:
+                output.append(f"\n**Count:** {len(items)} {count_text}\n")
+                output.extend([template.format_map(fields_of(item)) for item in items])
+            else:
+                output.append(f"\n{empty_msg}\n")
         
         # Comment Activity Analysis
         output.append("\n## 🗨️  Comment Activity Analysis (Least Recent First)")
@@ -792,53 +1215,42 @@ class JiraBoardWatcher:
             output.append(f"\n**Count:** {len(report.items_by_comment_activity)} active items analyzed\n")
             
             # Show top 10 items needing attention
-            items_needing_attention = [
-                item for item in report.items_by_comment_activity
-                if item['comment_count'] == 0 or (item['days_since_activity'] and item['days_since_activity'] > 3)
-            ]
+            items_needing_attention = report.items_needing_attention
+            attention_total = len(items_needing_attention)
             
             if items_needing_attention:
-                output.append(f"**⚠️  Items needing attention:** {len(items_needing_attention)} items with no comments or >3 days since last comment\n")
-                for idx, item in enumerate(items_needing_attention[:10], 1):
-                    output.append(f"{idx}. **{item['key']}**: {item['summary'][:60]}")
+                output.append(f"**⚠️  Items needing attention:** {attention_total} items with no comments or >3 days since last comment\n")
+                for idx, item in enumerate(islice(items_needing_attention, 10), 1):
+                    output.append(f"{idx}. **{item['key']}**: {item['summary_trunc']}")
                     output.append(f"   - Status: {item['status']} | Assignee: {item['assignee']}")
-                    output.append(f"   - Created: {item['created'][:10]}")
+                    output.append(f"   - Created: {item['created_date']}")
                     
                     if item['comment_count'] == 0:
                         output.append(f"   - Comments: ❌ NO COMMENTS ({item['days_since_activity']} days old)")
                     else:
-                        # Determine who made the last comment
-                        last_comment_by = ""
-                        if item['last_comment_by_team'] is True:
-                            last_comment_by = " 👥 [TEAM]"
-                        elif item['last_comment_by_team'] is False:
-                            last_comment_by = " 👤 [CUSTOMER]"
-                        
                         output.append(f"   - Comments: {item['comment_count']} total")
-                        output.append(f"   - Last comment: {item['last_comment_date'][:10]} ({item['days_since_activity']} days ago) by {item['last_comment_author']}{last_comment_by}")
+                        output.append(f"   - Last comment: {item['last_comment_date_short']} ({item['days_since_activity']} days ago) by {item['last_comment_author']}{item['last_comment_tag']}")
                     
-                    output.append(f"   - Link: https://cirium.atlassian.net/browse/{item['key']}")
+                    output.append(_ATTENTION_LINK_LINE % item['key'])
                 
-                if len(items_needing_attention) > 10:
-                    output.append(f"\n*...and {len(items_needing_attention) - 10} more items needing attention*")
+                if attention_total > 10:
+                    output.append(f"\n*...and {attention_total - 10} more items needing attention*")
             else:
                 output.append("\n✅ All items have recent comment activity!\n")
             
             # Summary stats
-            no_comment_count = sum(1 for i in report.items_by_comment_activity if i['comment_count'] == 0)
-            customer_last_comment_count = sum(1 for i in report.items_by_comment_activity if i.get('last_comment_by_team') is False)
             output.append(f"\n**Summary:**")
             output.append(f"- Total active issues: {len(report.items_by_comment_activity)}")
-            output.append(f"- Issues with NO comments: {no_comment_count}")
-            output.append(f"- Issues where CUSTOMER commented last: {customer_last_comment_count}")
-            output.append(f"- Issues needing attention: {len(items_needing_attention)}")
+            output.append(f"- Issues with NO comments: {report.no_comment_count}")
+            output.append(f"- Issues where CUSTOMER commented last: {report.customer_last_comment_count}")
+            output.append(f"- Issues needing attention: {attention_total}")
         else:
             output.append("\n✅ No active items to analyze.\n")
         
         output.append("\n---")
         output.append("\n*Report generated by SRE Board Watcher*")
         
-        return "\n".join(output)
+        return output
 
 
 def main():
@@ -851,8 +1263,7 @@ def main():
     config = {}
     config_path = os.path.join(os.path.dirname(__file__), 'config.yaml')
     try:
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f) or {}
+        config = _load_config(config_path)
         print(f"[INFO] Loaded configuration from {config_path}", file=sys.stderr)
     except FileNotFoundError:
         print(f"[WARN] Configuration file not found: {config_path}", file=sys.stderr)
@@ -880,28 +1291,25 @@ def main():
         print(f"[INFO] Team Name: {TEAM_NAME}", file=sys.stderr)
     
     # Initialize the watcher
-    watcher = JiraBoardWatcher(
+    with JiraBoardWatcher(
         jira_url=JIRA_URL,
         email=JIRA_EMAIL,
         api_token=JIRA_API_TOKEN,
         project_key=PROJECT_KEY,
         board_id=BOARD_ID,
         team_name=TEAM_NAME
-    )
-    
-    # Generate the report
-    report = watcher.generate_triage_report()
-    
-    # Format and print the report
-    formatted_report = watcher.format_report(report)
-    print(formatted_report)
+    ) as watcher:
+        # Generate the report
+        report = watcher.generate_triage_report()
+        
+        # Format and print the report
+        sys.stdout.writelines(line + "\n" for line in watcher.format_report_lines(report))
     
     # Return appropriate exit code
-    if report.stale_items or report.unacknowledged_comments or report.triage_items:
+    if report.needs_action:
         print("\n[WARN] Action required: stale items, unacknowledged comments, or items need triage!", file=sys.stderr)
-        return 1
     
-    return 0
+    return int(report.needs_action)
 
 
 if __name__ == "__main__":